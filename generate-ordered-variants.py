@@ -10,18 +10,25 @@ Usage:
 """
 
 import argparse
+import bisect
 import csv
+import ipaddress
 import json
+import operator
+import os
 import random
 import re
+import shutil
 import string
-import uuid
-from datetime import datetime, timedelta
-from decimal import Decimal, ROUND_HALF_UP
-from typing import Dict, List, Tuple, Optional
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import accumulate, chain, islice
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional
 
-from faker import Faker
-from mimesis import Person, Address, Text, Internet
+from mimesis import Person, Address, Text
 from mimesis.locales import Locale
 
 # -------------------- Configuration --------------------
@@ -31,72 +38,321 @@ DEFAULTS = {
     'max_variants_per_order': 5,
     # 'max_variants_per_order': 1,
     'max_quantity_per_item': 20,
-    'output_file': 'ordered_variants.csv'
+    'output_file': 'ordered_variants.csv',
+    'csv_buffer_size': 1 << 20,  # Output file buffer in bytes
+    'csv_chunk_rows': 10_000,  # Rows handed to writerows per call
+    'flush_every': 0,  # Flush the output file every N rows (0 = only on close)
+    'workers': 1  # Generator processes (1 = generate in-process)
 }
 
 # Columns to hide from CSV output
 hidden_columns_csv = ["duplicate_group_id"]
 
+STORE_ID = '1e27b743-d66d-41a4-8b4e-876b051a5948'  # Static store ID for all rows
+
+# Column order of a generated record; records are plain tuples in this order
+FIELDNAMES = (
+    'id', 'store_id', 'group_order_id', 'order_external_id', 'order_status', 'order_total_amount', 'order_currency',
+    'order_created_at', 'order_updated_at', 'customer_email', 'customer_phone_number',
+    'client_ip', 'shipping_first_name', 'shipping_last_name', 'shipping_address_1',
+    'shipping_address_2', 'shipping_city', 'shipping_state', 'shipping_postcode',
+    'shipping_country_code', 'product_external_id', 'product_title', 'product_description',
+    'product_vendor', 'product_type', 'variant_external_id', 'variant_title', 'variant_sku',
+    'variant_price', 'variant_attributes', 'variant_image_id', 'variant_image_src',
+    'line_item_external_id', 'line_item_quantity', 'line_item_unit_price',
+    'line_item_total_price', 'line_item_currency', 'line_item_subtotal',
+    'created_at', 'updated_at', 'duplicate_group_id'
+)
+FIELD_INDEX = {name: i for i, name in enumerate(FIELDNAMES)}
+
+# Money columns are carried as integers in minor units and only formatted when written:
+# cents for prices and totals, ten-thousandths for the subtotal (total * whole-percent factor)
+MONEY_FORMATS = {
+    'order_total_amount': (100, '%d.%02d'),
+    'variant_price': (100, '%d.%02d'),
+    'line_item_unit_price': (100, '%d.%02d'),
+    'line_item_total_price': (100, '%d.%02d'),
+    'line_item_subtotal': (10_000, '%d.%04d'),
+}
+
+# Record positions read back when deriving duplicate orders
+CUSTOMER_SLICE = slice(FIELD_INDEX['customer_email'], FIELD_INDEX['customer_phone_number'] + 1)
+LINE_ITEM_QUANTITY = FIELD_INDEX['line_item_quantity']
+LINE_ITEM_UNIT_PRICE = FIELD_INDEX['line_item_unit_price']
+SHIPPING_SLICE = slice(FIELD_INDEX['shipping_first_name'], FIELD_INDEX['shipping_country_code'] + 1)
+PRODUCT_VARIANT_SLICE = slice(FIELD_INDEX['product_external_id'], FIELD_INDEX['variant_image_src'] + 1)
+# line_item_total_price of a generate_line_item_values() tuple
+line_item_total = operator.itemgetter(FIELD_INDEX['line_item_total_price'] - FIELD_INDEX['product_external_id'])
+
 # -------------------- Data Pools --------------------
-ORDER_STATUSES = [
+# Pools are tuples so _choice() indexes them directly without any conversion
+ORDER_STATUSES = (
     'pending', 'processing', 'shipped', 'delivered', 'cancelled', 'refunded', 'completed'
-]
+)
 
-CURRENCIES = ['USD', 'EUR', 'GBP', 'CAD', 'AUD', 'CHF', 'JPY']
+CURRENCIES = ('USD', 'EUR', 'GBP', 'CAD', 'AUD', 'CHF', 'JPY')
 
-PRODUCT_CATEGORIES = [
+PRODUCT_CATEGORIES = (
     'Electronics', 'Clothing', 'Home & Garden', 'Sports & Outdoors', 'Books',
     'Health & Beauty', 'Toys & Games', 'Automotive', 'Tools & Hardware',
     'Jewelry & Watches', 'Music & Movies', 'Pet Supplies'
-]
+)
 
-PRODUCT_ADJECTIVES = [
+PRODUCT_ADJECTIVES = (
     'Premium', 'Deluxe', 'Professional', 'Classic', 'Modern', 'Vintage',
     'Eco-Friendly', 'Wireless', 'Portable', 'Heavy-Duty', 'Lightweight',
     'Waterproof', 'Stainless', 'Digital', 'Smart', 'Ultra', 'Pro', 'Max'
-]
+)
 
-PRODUCT_NOUNS = [
+PRODUCT_NOUNS = (
     'Widget', 'Device', 'Tool', 'Gadget', 'Accessory', 'Component', 'Kit',
     'Set', 'System', 'Solution', 'Product', 'Item', 'Unit', 'Piece'
-]
+)
 
 VARIANT_ATTRIBUTES = {
-    'color': ['Red', 'Blue', 'Green', 'Black', 'White', 'Gray', 'Silver', 'Gold', 'Brown', 'Purple'],
-    'size': ['XS', 'S', 'M', 'L', 'XL', 'XXL', '32', '34', '36', '38', '40', '42'],
-    'material': ['Cotton', 'Polyester', 'Leather', 'Metal', 'Plastic', 'Wood', 'Glass', 'Ceramic'],
-    'style': ['Classic', 'Modern', 'Vintage', 'Casual', 'Formal', 'Sport', 'Business']
+    'color': ('Red', 'Blue', 'Green', 'Black', 'White', 'Gray', 'Silver', 'Gold', 'Brown', 'Purple'),
+    'size': ('XS', 'S', 'M', 'L', 'XL', 'XXL', '32', '34', '36', '38', '40', '42'),
+    'material': ('Cotton', 'Polyester', 'Leather', 'Metal', 'Plastic', 'Wood', 'Glass', 'Ceramic'),
+    'style': ('Classic', 'Modern', 'Vintage', 'Casual', 'Formal', 'Sport', 'Business')
 }
+# Pre-rendered '"key": "value"' JSON members for every attribute value (json.dumps separators)
+VARIANT_ATTRIBUTE_MEMBERS = tuple(
+    tuple(f'{json.dumps(attr_type)}: {json.dumps(value)}' for value in values)
+    for attr_type, values in VARIANT_ATTRIBUTES.items()
+)
 
-VENDORS = [
+VENDORS = (
     'TechCorp', 'GlobalMart', 'PrimeBrand', 'MegaStore', 'EliteProducts',
     'InnovateCo', 'QualityFirst', 'BestChoice', 'TopTier', 'UltimateBrand',
     'SuperiorGoods', 'ExcellenceCorp', 'PremiumPlus', 'MaxValue', 'ProLine'
-]
+)
+
+# Intern the enumerated column values so every row shares one string object per value
+# (identifier-like literals already are; 'Home & Garden' and friends are not)
+ORDER_STATUSES, CURRENCIES, PRODUCT_CATEGORIES, VENDORS = (
+    tuple(map(sys.intern, pool)) for pool in (ORDER_STATUSES, CURRENCIES, PRODUCT_CATEGORIES, VENDORS)
+)
+
+# SKU prefixes AA..ZZ; a SKU is one of these plus a 4-digit number
+SKU_LETTER_PAIRS = tuple(a + b for a in string.ascii_uppercase for b in string.ascii_uppercase)
+SKU_SPACE = len(SKU_LETTER_PAIRS) * 10_000
+
+# Apartment lines used for shipping address_2
+APARTMENT_NUMBERS = tuple(f"Apt {number}" for number in range(1, 1000))
+
+# Common email domains with their specific rules
+EMAIL_DOMAINS = {
+    'gmail.com': 'gmail',
+    'yahoo.com': 'yahoo',
+    'hotmail.com': 'outlook',
+    'outlook.com': 'outlook',
+    'aol.com': 'other',
+    'icloud.com': 'other',
+    'protonmail.com': 'other'
+}
+_DOMAIN_KEYS = tuple(EMAIL_DOMAINS)
+_GMAIL_DOMAINS = frozenset(('gmail.com', 'googlemail.com'))
+
+# Local-part layouts for generated emails
+EMAIL_LOCAL_PATTERNS = (
+    '{first}.{last}',
+    '{first}{last}',
+    '{first[0]}.{last}',
+    '{first}.{last[0]}',
+    '{first}_{last}',
+    '{last}.{first}'
+)
+
+# Number suffixes sometimes appended to the local part
+EMAIL_NUMBER_RANGES = (
+    (1, 99),
+    (1980, 2005),  # Birth years
+    (1, 999)
+)
+
+# Common domain mistakes based on real data
+EMAIL_DOMAIN_MISTAKES = {
+    'gmail.com': ('gmai.com', 'gmial.com', 'gmail.co', 'gmaill.com', 'gmailcom', 'gail.com'),
+    'yahoo.com': ('yaho.com', 'yahoo.co', 'yahooo.com', 'yhoo.com', 'ymail.com'),
+    'hotmail.com': ('hotmai.com', 'hotmal.com', 'hotmial.com', 'hotmailcom', 'htmail.com'),
+    'outlook.com': ('outlok.com', 'outlook.co', 'outloo.com'),
+    'aol.com': ('ao.com', 'aoll.com', 'aol.co'),
+    'icloud.com': ('iclou.com', 'icloud.co', 'icoud.com'),
+    'protonmail.com': ('protonmai.com', 'protonmail.co', 'proton.com')
+}
+
+# Fixed Gmail +alias tags (numeric tags are drawn per call)
+GMAIL_ALIAS_TAGS = ('work', 'shop', 'personal', 'home', 'business', 'spam', 'newsletter')
+
+# US area codes: avoid 0, 1 in first digit, and some reserved ranges
+VALID_AREA_CODES = (
+    # Major US cities
+    212, 646, 917, 347,  # NYC
+    213, 323, 424, 747,  # LA
+    312, 773, 872,       # Chicago
+    415, 628,            # San Francisco
+    202,                 # Washington DC
+    305, 786,            # Miami
+    404, 678, 470,       # Atlanta
+    617, 857,            # Boston
+    # Other common area codes
+    201, 203, 206, 207, 208, 209, 210, 214, 215, 216, 217, 218, 219,
+    224, 225, 228, 229, 231, 234, 239, 240, 248, 251, 252, 253, 254,
+    256, 260, 262, 267, 269, 270, 276, 281, 301, 302, 303, 304, 307,
+    308, 309, 310, 313, 314, 315, 316, 317, 318, 319, 320, 321, 330,
+    331, 334, 336, 337, 339, 341, 351, 352, 360, 361, 364, 365, 386,
+    401, 402, 403, 405, 406, 407, 408, 409, 410, 412, 413, 414, 417,
+    419, 423, 425, 430, 432, 434, 435, 440, 443, 445, 458, 463, 469,
+    470, 475, 478, 479, 480, 484, 501, 502, 503, 504, 505, 507, 508,
+    509, 510, 512, 513, 515, 516, 517, 518, 520, 530, 540, 541, 551,
+    559, 561, 562, 563, 564, 567, 570, 571, 573, 574, 575, 580, 585,
+    586, 601, 602, 603, 605, 606, 607, 608, 609, 610, 612, 614, 615,
+    616, 618, 619, 620, 623, 626, 630, 631, 636, 641, 646, 650, 651,
+    657, 660, 661, 662, 667, 669, 678, 682, 701, 702, 703, 704, 706,
+    707, 708, 712, 713, 714, 715, 716, 717, 718, 719, 720, 724, 725,
+    727, 731, 732, 734, 737, 740, 743, 747, 754, 757, 760, 762, 763,
+    765, 770, 772, 774, 775, 779, 781, 785, 786, 787, 801, 802, 803,
+    804, 805, 806, 808, 810, 812, 813, 814, 815, 816, 817, 818, 828,
+    830, 831, 832, 835, 843, 845, 847, 848, 850, 856, 857, 858, 859,
+    860, 862, 863, 864, 865, 870, 872, 878, 901, 903, 904, 906, 907,
+    908, 909, 910, 912, 913, 914, 915, 916, 917, 918, 919, 920, 925,
+    928, 929, 930, 931, 934, 936, 937, 940, 941, 947, 949, 951, 952,
+    954, 956, 959, 970, 971, 972, 973, 978, 979, 980, 984, 985, 989
+)
+
+# Phone format templates, filled with (area code, exchange, line number)
+PHONE_FORMATS = (
+    '({}) {}-{}',       # Most common
+    '{}-{}-{}',         # Common
+    '+1 ({}) {}-{}',    # International
+    '1-{}-{}-{}',       # With country code
+    '{}.{}.{}',         # Dot separated
+)
+# Weight towards more common phone formats (see generate_realistic_phone)
+PHONE_FORMAT_CUM_WEIGHTS = tuple(accumulate((0.5, 0.25, 0.1, 0.1, 0.05)))
+
+# Format variations people actually use when re-typing a number (see pollute_phone)
+PHONE_POLLUTION_FORMATS = (
+    '({}) {}-{}', '{}-{}-{}', '{}.{}.{}', '{} {} {}', '+1 {} {} {}',
+    '+1({}){}-{}', '1-{}-{}-{}',
+    '{}{}{}',  # No formatting
+    '{}-{}{}'  # Area code separated
+)
+US_PHONE_FORMAT = '({}) {}-{}'
+
+# Similar looking characters or adjacent keys for each digit
+DIGIT_MISTAKES = {
+    '0': ('O', '9', '1'), '1': ('l', 'I', '7'), '2': ('Z', '3'), '3': ('E', '8'),
+    '4': ('A', '7'), '5': ('S', '6'), '6': ('G', '9'), '7': ('T', '1'),
+    '8': ('B', '3'), '9': ('g', '6', '0')
+}
+
+# Price ranges based on typical e-commerce
+PRICE_RANGES = (
+    (5, 50),      # 40% - low price items
+    (50, 200),    # 30% - medium price items
+    (200, 1000),  # 20% - high price items
+    (1000, 5000)  # 10% - premium items
+)
+PRICE_RANGE_CUM_WEIGHTS = tuple(accumulate((0.4, 0.3, 0.2, 0.1)))
+
+# Non-public IPv4 blocks that client IPs are never drawn from, as (network, netmask) ints
+NON_PUBLIC_IPV4_NETWORKS = tuple(
+    (int(net.network_address), int(net.netmask)) for net in map(ipaddress.ip_network, (
+        '0.0.0.0/8', '10.0.0.0/8', '100.64.0.0/10', '127.0.0.0/8', '169.254.0.0/16',
+        '172.16.0.0/12', '192.0.0.0/24', '192.0.2.0/24', '192.168.0.0/16', '198.18.0.0/15',
+        '198.51.100.0/24', '203.0.113.0/24', '224.0.0.0/3'
+    ))
+)
 
-# Initialize Faker and Mimesis
-fake = Faker()
+# Initialize Mimesis (locale-specific names, addresses and text)
 person = Person(Locale.EN)
 address = Address(Locale.EN)
 text = Text(Locale.EN)
-internet = Internet()
+
+# Mimesis values are drawn into per-run pools (see build_mimesis_pools) and sampled with
+# _choice afterwards, which skips the provider call overhead per field. Each pool is an
+# unbiased sample of the provider's own distribution; the trade-off is that a run sees at
+# most MIMESIS_POOL_SIZE distinct values per field.
+MIMESIS_POOL_SIZE = 10_000
+MIMESIS_POOL_SOURCES = {
+    'first_name': person.first_name,
+    'last_name': person.last_name,
+    'street_name': address.street_name,
+    'street_suffix': address.street_suffix,
+    'city': address.city,
+    'state': address.state,
+    'postal_code': address.postal_code,
+    'country_code': address.country_code,
+    'sentence': text.sentence,
+}
+MIMESIS_POOLS: Dict[str, Tuple[str, ...]] = {}
 
 # -------------------- Helper Functions --------------------
+def build_mimesis_pools(size: int):
+    """(Re)fill MIMESIS_POOLS with `size` draws per field from the (seeded) providers."""
+    for field, source in MIMESIS_POOL_SOURCES.items():
+        MIMESIS_POOLS[field] = tuple(source() for _ in range(size))
+
+# All randomness goes through the module-level `random` generator (seeded once in
+# generate_ordered_variants_data) via these thin helpers.
+def _choice(seq):
+    """Uniform pick from a non-empty sequence with a single random.random() draw."""
+    return seq[int(random.random() * len(seq))]
+
+def _weighted(options, cum_weights):
+    """Weighted pick from options using precomputed cumulative weights."""
+    return options[bisect.bisect(cum_weights, random.random() * cum_weights[-1], 0, len(options) - 1)]
+
+def _randint(low: int, high: int) -> int:
+    """Random integer in [low, high] drawn from a single random.random() call.
+
+    random.randint goes through randrange/_randbelow on every call, which costs
+    several times more than the draw itself in the per-variant hot path.
+    """
+    return low + int(random.random() * (high - low + 1))
+
+@lru_cache(maxsize=1024)
+def _applicable_choices(options: Tuple[str, ...], weights: Tuple[float, ...],
+                        applicable: Tuple[bool, ...]) -> Tuple[Tuple[str, ...], Tuple[float, ...]]:
+    """Options (and cumulative weights) restricted to the strategies that apply to an input.
+
+    Inputs fall into a handful of shapes, so the filtered tables are cached on
+    the applicability flags instead of being rebuilt per call.
+    """
+    kept = [(option, weight) for option, weight, ok in zip(options, weights, applicable) if ok]
+    return tuple(option for option, _ in kept), tuple(accumulate(weight for _, weight in kept))
+
+# Version 4 / RFC 4122 variant bits of a 128-bit UUID
+_UUID4_CLEAR_MASK = ~((0xF << 76) | (0x3 << 62)) & ((1 << 128) - 1)
+_UUID4_SET_BITS = (0x4 << 76) | (0x2 << 62)
+
 def generate_uuid() -> str:
-    """Generate a UUID4 string."""
-    return str(uuid.uuid4())
+    """Generate a UUID4-formatted string from the seeded generator.
+
+    Row ids don't need cryptographic randomness, so this skips uuid4's
+    os.urandom call per id and keeps ids reproducible for a given seed.
+    """
+    h = '%032x' % (random.getrandbits(128) & _UUID4_CLEAR_MASK | _UUID4_SET_BITS)
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 def generate_external_id(prefix: str) -> str:
     """Generate an external ID with prefix."""
-    return f"{prefix}_{random.randint(1, 9_999_999)}"
+    return f"{prefix}_{_randint(1, 9_999_999)}"
 
 def generate_duplicate_id() -> str:
     """Generate a duplicate ID for linking related records."""
-    return f"DUP_{random.randint(1, 9_999_999)}"
+    return f"DUP_{_randint(1, 9_999_999)}"
 
 def generate_ip_address() -> str:
-    """Generate a random IP address using Faker."""
-    return fake.ipv4()
+    """Generate a random public IPv4 address."""
+    while True:
+        ip = random.getrandbits(32)
+        for network, netmask in NON_PUBLIC_IPV4_NETWORKS:
+            if ip & netmask == network:
+                break
+        else:
+            return f"{ip >> 24}.{ip >> 16 & 255}.{ip >> 8 & 255}.{ip & 255}"
 
 # -------------------- Advanced Data Pollution/Dirty Algorithms --------------------
 
@@ -107,15 +363,17 @@ KEYBOARD_LAYOUT = {
     'z': 'asx', 'x': 'zsdc', 'c': 'xdfv', 'v': 'cfgb', 'b': 'vghn', 'n': 'bhjm', 'm': 'njk',
     '1': '2', '2': '13', '3': '24', '4': '35', '5': '46', '6': '57', '7': '68', '8': '79', '9': '80', '0': '9'
 }
+# Keys a double-hit insertion can produce: the key itself or one of its neighbours
+KEYBOARD_INSERT_CHOICES = {key: key + adjacent for key, adjacent in KEYBOARD_LAYOUT.items()}
 
 # Common OCR and handwriting mistakes
 OCR_MISTAKES = {
-    '0': ['O', 'o', 'Q'], 'O': ['0', 'o', 'Q'], 'o': ['0', 'O'],
-    '1': ['l', 'I', '|'], 'l': ['1', 'I'], 'I': ['1', 'l'],
-    '5': ['S', 's'], 'S': ['5', 's'], 's': ['S', '5'],
-    '6': ['G', 'g'], 'G': ['6', 'g'], 'g': ['G', '6'],
-    '8': ['B', 'b'], 'B': ['8', 'b'], 'b': ['B', '8'],
-    'rn': ['m'], 'm': ['rn'], 'cl': ['d'], 'd': ['cl']
+    '0': ('O', 'o', 'Q'), 'O': ('0', 'o', 'Q'), 'o': ('0', 'O'),
+    '1': ('l', 'I', '|'), 'l': ('1', 'I'), 'I': ('1', 'l'),
+    '5': ('S', 's'), 'S': ('5', 's'), 's': ('S', '5'),
+    '6': ('G', 'g'), 'G': ('6', 'g'), 'g': ('G', '6'),
+    '8': ('B', 'b'), 'B': ('8', 'b'), 'b': ('B', '8'),
+    'rn': ('m',), 'm': ('rn',), 'cl': ('d',), 'd': ('cl',)
 }
 
 # Common phonetic mistakes
@@ -124,86 +382,227 @@ PHONETIC_MISTAKES = {
     'i': 'y', 'y': 'i', 'ei': 'ie', 'ie': 'ei'
 }
 
-def introduce_realistic_typos(text: str, prob: float = 0.3) -> str:
-    """Introduce realistic typos based on keyboard layout and human patterns."""
-    if not text or random.random() > prob:
-        return text
-    
-    text_list = list(text.lower())
-    num_errors = random.randint(1, min(3, max(1, len(text) // 5)))  # Scale errors with text length
-    
-    for _ in range(num_errors):
-        if len(text_list) < 2:
+# Weighted pollution strategies (options and weights kept side by side)
+TYPO_ERROR_TYPES = ('keyboard_adjacent', 'transposition', 'omission', 'insertion', 'ocr_mistake', 'phonetic')
+TYPO_ERROR_CUM_WEIGHTS = tuple(accumulate((0.4, 0.2, 0.15, 0.1, 0.1, 0.05)))
+
+GMAIL_POLLUTION_TYPES = ('typo_local', 'typo_domain', 'domain_mistake', 'gmail_dot_variation', 'gmail_plus_alias', 'case_variation')
+GMAIL_POLLUTION_WEIGHTS = (0.2, 0.1, 0.15, 0.3, 0.2, 0.05)
+
+EMAIL_POLLUTION_TYPES = ('typo_local', 'typo_domain', 'domain_mistake', 'case_variation', 'number_variation')
+EMAIL_POLLUTION_WEIGHTS = (0.4, 0.2, 0.25, 0.1, 0.05)
+
+PHONE_POLLUTION_TYPES = ('format_variation', 'digit_transposition', 'digit_substitution', 'partial_number', 'extra_digits', 'spacing_errors')
+PHONE_POLLUTION_CUM_WEIGHTS = tuple(accumulate((0.3, 0.2, 0.2, 0.1, 0.1, 0.1)))
+
+ADDRESS_POLLUTION_TYPES = ('typo', 'abbreviation_variation', 'case_inconsistency', 'spacing_errors', 'number_errors', 'direction_errors')
+ADDRESS_POLLUTION_CUM_WEIGHTS = tuple(accumulate((0.25, 0.3, 0.15, 0.15, 0.1, 0.05)))
+
+NAME_POLLUTION_TYPES = ('typo', 'case_variation', 'nickname_substitution', 'initial_variation', 'cultural_variation', 'hyphenation')
+NAME_POLLUTION_WEIGHTS = (0.25, 0.2, 0.2, 0.15, 0.1, 0.1)
+
+# Extended nickname mapping based on real usage
+NICKNAME_MAP = {
+    'Alexander': ('Alex', 'Xander', 'Al', 'Alec'), 'Alexandra': ('Alex', 'Alexa', 'Sandra', 'Sasha'),
+    'Andrew': ('Andy', 'Drew'), 'Anthony': ('Tony', 'Anton'), 'Benjamin': ('Ben', 'Benny', 'Benji'),
+    'Catherine': ('Cat', 'Cathy', 'Kate', 'Katie'), 'Christopher': ('Chris', 'Christie', 'Topher'),
+    'Daniel': ('Dan', 'Danny'), 'David': ('Dave', 'Davey'), 'Edward': ('Ed', 'Eddie', 'Ted'),
+    'Elizabeth': ('Liz', 'Beth', 'Betty', 'Eliza'), 'Emily': ('Em', 'Emmy'), 'Gregory': ('Greg',),
+    'James': ('Jim', 'Jimmy', 'Jamie'), 'Jennifer': ('Jen', 'Jenny'), 'Jessica': ('Jess', 'Jessie'),
+    'John': ('Johnny', 'Jack'), 'Jonathan': ('Jon', 'Johnny'), 'Joseph': ('Joe', 'Joey'),
+    'Joshua': ('Josh',), 'Kenneth': ('Ken', 'Kenny'), 'Margaret': ('Maggie', 'Meg', 'Peggy'),
+    'Matthew': ('Matt', 'Matty'), 'Michael': ('Mike', 'Mick', 'Mickey'), 'Nicholas': ('Nick', 'Nicky'),
+    'Patricia': ('Pat', 'Patty', 'Tricia'), 'Rebecca': ('Becky', 'Becca'), 'Richard': ('Rick', 'Rich', 'Dick'),
+    'Robert': ('Bob', 'Rob', 'Bobby'), 'Samuel': ('Sam', 'Sammy'), 'Stephen': ('Steve', 'Stevie'),
+    'Susan': ('Sue', 'Susie'), 'Thomas': ('Tom', 'Tommy'), 'William': ('Bill', 'Will', 'Billy')
+}
+
+# Cultural name variations (simplified)
+CULTURAL_NAME_MAP = {
+    'John': ('Jon', 'Johan', 'Juan', 'Giovanni'), 'Mary': ('Maria', 'Marie'),
+    'Peter': ('Pedro', 'Pietro'), 'Paul': ('Pablo', 'Paolo'),
+    'Michael': ('Miguel', 'Michele'), 'David': ('Davide',)
+}
+
+# Patterns used on every pollution/email call, compiled once at import
+_NONDIGIT_RE = re.compile(r'\D')
+_DIGITS_RE = re.compile(r'\d+')
+_NON_ALPHA_RE = re.compile(r'[^a-zA-Z]')
+
+# Realistic address abbreviation variations
+ADDRESS_ABBREVIATIONS = {
+    # Street types
+    'Street': ('St', 'St.', 'Str', 'Strt', 'street'),
+    'Avenue': ('Ave', 'Ave.', 'Av', 'Avn', 'avenue'),
+    'Drive': ('Dr', 'Dr.', 'Drv', 'Driv', 'drive'),
+    'Road': ('Rd', 'Rd.', 'Ro', 'road'),
+    'Boulevard': ('Blvd', 'Blvd.', 'Bld', 'Blv', 'boulevard'),
+    'Lane': ('Ln', 'Ln.', 'lane'),
+    'Court': ('Ct', 'Ct.', 'court'),
+    'Place': ('Pl', 'Pl.', 'place'),
+    'Circle': ('Cir', 'Cir.', 'circle'),
+    'Way': ('Wy', 'way'),
+    # Unit types
+    'Apartment': ('Apt', 'Apt.', '#', 'Unit', 'apartment'),
+    'Suite': ('Ste', 'Ste.', '#', 'Su', 'suite'),
+    'Unit': ('Apt', '#', 'unit'),
+    'Building': ('Bldg', 'Bldg.', 'Bld', 'building'),
+    # Directions
+    'North': ('N', 'N.', 'north'),
+    'South': ('S', 'S.', 'south'),
+    'East': ('E', 'E.', 'east'),
+    'West': ('W', 'W.', 'west'),
+    'Northeast': ('NE', 'N.E.', 'northeast'),
+    'Northwest': ('NW', 'N.W.', 'northwest'),
+    'Southeast': ('SE', 'S.E.', 'southeast'),
+    'Southwest': ('SW', 'S.W.', 'southwest')
+}
+_ABBREV_LOOKUP = {full.lower(): variations for full, variations in ADDRESS_ABBREVIATIONS.items()}
+# Longest words first so 'Northeast' wins over 'North' at the same position
+_ABBREV_RE = re.compile(
+    '|'.join(re.escape(full) for full in sorted(ADDRESS_ABBREVIATIONS, key=len, reverse=True)),
+    re.IGNORECASE
+)
+
+# Byte table mapping ASCII lowercase letters to the case bit (0x20) and everything else to 0
+_CASE_BIT_TABLE = bytes(0x20 if 0x61 <= b <= 0x7a else 0 for b in range(256))
+
+def _random_case(text: str) -> str:
+    """Upper- or lowercase each letter of text independently with probability 1/2.
+
+    ASCII input is handled as one big integer: lowercase it, mask random bits
+    down to the case bit of each letter and XOR, instead of branching per char.
+    """
+    if not text.isascii():
+        return ''.join(_choice((c.upper(), c.lower())) for c in text)
+    raw = text.lower().encode('ascii')
+    flips = random.getrandbits(8 * len(raw)) & int.from_bytes(raw.translate(_CASE_BIT_TABLE), 'big')
+    return (int.from_bytes(raw, 'big') ^ flips).to_bytes(len(raw), 'big').decode('ascii')
+
+def _proper_case(text: str) -> str:
+    """Uppercase the first letter of every space-separated word, lowercase the rest."""
+    return ' '.join(word[:1].upper() + word[1:].lower() for word in text.split(' '))
+
+# Case patterns people actually use for names and addresses
+CASE_PATTERNS = (
+    str.upper,       # ALL CAPS / JOHN
+    str.lower,       # all lowercase / john
+    str.title,       # Title Case / John
+    str.capitalize,  # First letter only
+    _proper_case     # Proper case
+)
+
+# Direction mix-ups, as whole space-delimited words (common in data entry)
+DIRECTION_SWAPS = tuple(
+    (f' {old} ', f' {new} ') for old, new in
+    {'N': 'S', 'S': 'N', 'E': 'W', 'W': 'E', 'NE': 'NW', 'NW': 'NE', 'SE': 'SW', 'SW': 'SE'}.items()
+)
+
+def _apply_typos(chars: List[str], error_types: List[str], offsets: List[float]) -> List[str]:
+    """Apply pre-drawn typo operations to a character buffer and return the result.
+
+    Each offset is a uniform draw in [0, 1) scaled to the buffer length at the time
+    the error is applied, since omissions and insertions change that length.
+    """
+    for error_type, offset in zip(error_types, offsets):
+        length = len(chars)
+        if length < 2:
             break
-            
-        error_type = random.choices(
-            ['keyboard_adjacent', 'transposition', 'omission', 'insertion', 'ocr_mistake', 'phonetic'],
-            weights=[0.4, 0.2, 0.15, 0.1, 0.1, 0.05]
-        )[0]
         
-        pos = random.randint(0, len(text_list) - 1)
-        char = text_list[pos]
+        pos = int(offset * length)
+        char = chars[pos]
         
-        if error_type == 'keyboard_adjacent' and char in KEYBOARD_LAYOUT:
+        if error_type == 'keyboard_adjacent':
             # Replace with adjacent key
-            adjacent_chars = KEYBOARD_LAYOUT[char]
+            adjacent_chars = KEYBOARD_LAYOUT.get(char)
             if adjacent_chars:
-                text_list[pos] = random.choice(adjacent_chars)
+                chars[pos] = _choice(adjacent_chars)
                 
-        elif error_type == 'transposition' and pos < len(text_list) - 1:
+        elif error_type == 'transposition' and pos < length - 1:
             # Swap adjacent characters (very common human error)
-            text_list[pos], text_list[pos + 1] = text_list[pos + 1], text_list[pos]
+            chars[pos], chars[pos + 1] = chars[pos + 1], chars[pos]
             
-        elif error_type == 'omission' and len(text_list) > 3:
+        elif error_type == 'omission' and length > 3:
             # Skip a character (fast typing error)
-            text_list.pop(pos)
+            chars.pop(pos)
             
         elif error_type == 'insertion':
             # Accidentally hit a key twice
-            if char in KEYBOARD_LAYOUT:
-                insert_char = random.choice([char] + list(KEYBOARD_LAYOUT[char]))
-                text_list.insert(pos, insert_char)
-            else:
-                text_list.insert(pos, char)  # Double character
+            insert_choices = KEYBOARD_INSERT_CHOICES.get(char)
+            chars.insert(pos, _choice(insert_choices) if insert_choices else char)  # Else double character
                 
-        elif error_type == 'ocr_mistake' and char in OCR_MISTAKES:
+        elif error_type == 'ocr_mistake':
             # OCR-like mistakes
-            text_list[pos] = random.choice(OCR_MISTAKES[char])
+            ocr_choices = OCR_MISTAKES.get(char)
+            if ocr_choices:
+                chars[pos] = _choice(ocr_choices)
             
         elif error_type == 'phonetic':
             # Phonetic spelling mistakes
-            text_str = ''.join(text_list)
+            text_str = ''.join(chars)
             for wrong, right in PHONETIC_MISTAKES.items():
                 if wrong in text_str:
-                    text_str = text_str.replace(wrong, right, 1)
-                    text_list = list(text_str)
+                    chars = list(text_str.replace(wrong, right, 1))
                     break
     
-    return ''.join(text_list)
+    return chars
 
-def pollute_email(email: str) -> str:
-    """Apply realistic pollution to email addresses with proper domain-specific rules."""
-    if not email:
-        return email
+def introduce_realistic_typos(text: str, prob: float = 0.3) -> str:
+    """Introduce realistic typos based on keyboard layout and human patterns."""
+    if not text or random.random() > prob:
+        return text
+    
+    num_errors = _randint(1, min(3, max(1, len(text) // 5)))  # Scale errors with text length
     
+    # Draw all error types and positions up front, then run the mutation kernel once
+    error_types = random.choices(TYPO_ERROR_TYPES, cum_weights=TYPO_ERROR_CUM_WEIGHTS, k=num_errors)
+    offsets = [random.random() for _ in range(num_errors)]
+    
+    return ''.join(_apply_typos(list(text.lower()), error_types, offsets))
+
+# The pollute_* helpers below cache their deterministic per-input preparation: every
+# duplicate in a group re-pollutes the same original value, so these hit repeatedly.
+@lru_cache(maxsize=1024)
+def _email_pollution_plan(email: str) -> Tuple[str, str, Tuple[str, ...], Tuple[float, ...]]:
+    """Split an email and pick the pollution strategies that apply to it."""
     local, domain = email.split('@', 1)
     
+    # Weighted distribution of common email errors, skipping ones that cannot apply
+    has_mistakes = domain in EMAIL_DOMAIN_MISTAKES
     # Determine if this is Gmail (where dots don't matter and +aliases work)
-    is_gmail = domain.lower() in ['gmail.com', 'googlemail.com']
-    
-    # Weighted distribution of common email errors
-    if is_gmail:
+    if domain.lower() in _GMAIL_DOMAINS:
         # Gmail-specific pollution (dots and +tags are acceptable variations)
-        pollution_type = random.choices(
-            ['typo_local', 'typo_domain', 'domain_mistake', 'gmail_dot_variation', 'gmail_plus_alias', 'case_variation'],
-            weights=[0.2, 0.1, 0.15, 0.3, 0.2, 0.05]
-        )[0]
+        can_dot = '.' in local or len(local) > 3
+        options, cum_weights = _applicable_choices(
+            GMAIL_POLLUTION_TYPES, GMAIL_POLLUTION_WEIGHTS,
+            (True, True, has_mistakes, can_dot, True, True))
     else:
         # Other domains (dots and +tags create different email addresses)
-        pollution_type = random.choices(
-            ['typo_local', 'typo_domain', 'domain_mistake', 'case_variation', 'number_variation'],
-            weights=[0.4, 0.2, 0.25, 0.1, 0.05]
-        )[0]
+        options, cum_weights = _applicable_choices(
+            EMAIL_POLLUTION_TYPES, EMAIL_POLLUTION_WEIGHTS,
+            (True, True, has_mistakes, True, True))
+    return local, domain, options, cum_weights
+
+@lru_cache(maxsize=1024)
+def _phone_digits(phone: str) -> str:
+    """Digits of a phone number."""
+    return _NONDIGIT_RE.sub('', phone)
+
+@lru_cache(maxsize=1024)
+def _name_pollution_choices(name: str) -> Tuple[Tuple[str, ...], Tuple[float, ...]]:
+    """Name pollution strategies (and cumulative weights) that apply to this name."""
+    can_hyphenate = '-' in name or (' ' in name and len(name.split()) == 2)
+    return _applicable_choices(
+        NAME_POLLUTION_TYPES, NAME_POLLUTION_WEIGHTS,
+        (True, True, name in NICKNAME_MAP, True, name in CULTURAL_NAME_MAP, can_hyphenate))
+
+def pollute_email(email: str) -> str:
+    """Apply realistic pollution to email addresses with proper domain-specific rules."""
+    if not email:
+        return email
+    
+    local, domain, options, cum_weights = _email_pollution_plan(email)
+    pollution_type = _weighted(options, cum_weights)
     
     if pollution_type == 'typo_local':
         # Introduce realistic typos in local part
@@ -213,18 +612,8 @@ def pollute_email(email: str) -> str:
         domain = introduce_realistic_typos(domain, 0.3)
     elif pollution_type == 'domain_mistake':
         # Common domain mistakes based on real data
-        domain_mistakes = {
-            'gmail.com': ['gmai.com', 'gmial.com', 'gmail.co', 'gmaill.com', 'gmailcom', 'gail.com'],
-            'yahoo.com': ['yaho.com', 'yahoo.co', 'yahooo.com', 'yhoo.com', 'ymail.com'],
-            'hotmail.com': ['hotmai.com', 'hotmal.com', 'hotmial.com', 'hotmailcom', 'htmail.com'],
-            'outlook.com': ['outlok.com', 'outlook.co', 'outloo.com'],
-            'aol.com': ['ao.com', 'aoll.com', 'aol.co'],
-            'icloud.com': ['iclou.com', 'icloud.co', 'icoud.com'],
-            'protonmail.com': ['protonmai.com', 'protonmail.co', 'proton.com']
-        }
-        if domain in domain_mistakes:
-            domain = random.choice(domain_mistakes[domain])
-    elif pollution_type == 'gmail_dot_variation' and is_gmail:
+        domain = _choice(EMAIL_DOMAIN_MISTAKES[domain])
+    elif pollution_type == 'gmail_dot_variation':
         # Gmail-specific: dots can be added/removed (same email address)
         if '.' not in local and len(local) > 3:
             # Add dots at valid positions
@@ -235,27 +624,32 @@ def pollute_email(email: str) -> str:
             local = ''.join(local_list)
         elif '.' in local:
             # Remove some dots (Gmail ignores them anyway)
-            local = local.replace('.', '', random.randint(1, local.count('.')))
-    elif pollution_type == 'gmail_plus_alias' and is_gmail:
+            local = local.replace('.', '', _randint(1, local.count('.')))
+    elif pollution_type == 'gmail_plus_alias':
         # Gmail-specific: add +alias (same email address)
-        aliases = ['work', 'shop', 'personal', 'home', 'business', 'spam', 'newsletter', 
-                  str(random.randint(1, 999)), str(random.randint(2000, 2024))]
-        alias = random.choice(aliases)
+        # Either a fixed tag or one of two numeric tags, all equally likely
+        slot = int(random.random() * (len(GMAIL_ALIAS_TAGS) + 2))
+        if slot < len(GMAIL_ALIAS_TAGS):
+            alias = GMAIL_ALIAS_TAGS[slot]
+        elif slot == len(GMAIL_ALIAS_TAGS):
+            alias = str(_randint(1, 999))
+        else:
+            alias = str(_randint(2000, 2024))
         # Remove existing +alias if present
         if '+' in local:
             local = local.split('+')[0]
         local = f"{local}+{alias}"
     elif pollution_type == 'case_variation':
         # Mix case (most email servers are case-insensitive for local part)
-        local = ''.join(random.choice([c.upper(), c.lower()]) for c in local)
+        local = _random_case(local)
     elif pollution_type == 'number_variation':
         # Add or modify numbers (creates a different email address)
         if any(c.isdigit() for c in local):
             # Modify existing numbers
-            local = ''.join(str(random.randint(0, 9)) if c.isdigit() and random.random() < 0.5 else c for c in local)
+            local = ''.join(str(_randint(0, 9)) if c.isdigit() and random.random() < 0.5 else c for c in local)
         else:
             # Add numbers
-            local += str(random.randint(1, 999))
+            local += str(_randint(1, 999))
     
     return f"{local}@{domain}"
 
@@ -265,66 +659,47 @@ def pollute_phone(phone: str) -> str:
         return phone
     
     # Extract digits only
-    digits = re.sub(r'\D', '', phone)
+    digits = _phone_digits(phone)
     if len(digits) < 10:
         return phone
     
     # Weighted distribution of phone number errors
-    pollution_type = random.choices(
-        ['format_variation', 'digit_transposition', 'digit_substitution', 'partial_number', 'extra_digits', 'spacing_errors'],
-        weights=[0.3, 0.2, 0.2, 0.1, 0.1, 0.1]
-    )[0]
+    pollution_type = _weighted(PHONE_POLLUTION_TYPES, PHONE_POLLUTION_CUM_WEIGHTS)
     
     if pollution_type == 'format_variation':
         # Realistic format variations people actually use
-        formats = [
-            f"({digits[:3]}) {digits[3:6]}-{digits[6:]}",
-            f"{digits[:3]}-{digits[3:6]}-{digits[6:]}",
-            f"{digits[:3]}.{digits[3:6]}.{digits[6:]}",
-            f"{digits[:3]} {digits[3:6]} {digits[6:]}",
-            f"+1 {digits[:3]} {digits[3:6]} {digits[6:]}",
-            f"+1({digits[:3]}){digits[3:6]}-{digits[6:]}",
-            f"1-{digits[:3]}-{digits[3:6]}-{digits[6:]}",
-            digits,  # No formatting
-            f"{digits[:3]}-{digits[3:]}"  # Area code separated
-        ]
-        return random.choice(formats)
+        return _choice(PHONE_POLLUTION_FORMATS).format(digits[:3], digits[3:6], digits[6:])
     elif pollution_type == 'digit_transposition':
         # Swap adjacent digits (common typing error)
         digits_list = list(digits)
-        pos = random.randint(0, len(digits_list) - 2)
+        pos = _randint(0, len(digits_list) - 2)
         digits_list[pos], digits_list[pos + 1] = digits_list[pos + 1], digits_list[pos]
         digits = ''.join(digits_list)
-        return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
+        return US_PHONE_FORMAT.format(digits[:3], digits[3:6], digits[6:])
     elif pollution_type == 'digit_substitution':
         # Replace digits with similar looking ones or adjacent keys
-        digit_mistakes = {
-            '0': ['O', '9', '1'], '1': ['l', 'I', '7'], '2': ['Z', '3'], '3': ['E', '8'],
-            '4': ['A', '7'], '5': ['S', '6'], '6': ['G', '9'], '7': ['T', '1'],
-            '8': ['B', '3'], '9': ['g', '6', '0']
-        }
         digits_list = list(digits)
-        pos = random.randint(0, len(digits_list) - 1)
-        if digits_list[pos] in digit_mistakes:
+        pos = _randint(0, len(digits_list) - 1)
+        if digits_list[pos] in DIGIT_MISTAKES:
             if random.random() < 0.7:  # Usually replace with number
-                digits_list[pos] = str(random.randint(0, 9))
+                digits_list[pos] = str(_randint(0, 9))
             else:  # Sometimes with letter (OCR-like error)
-                digits_list[pos] = random.choice(digit_mistakes[digits_list[pos]])
+                digits_list[pos] = _choice(DIGIT_MISTAKES[digits_list[pos]])
         digits = ''.join(digits_list)
-        return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
+        return US_PHONE_FORMAT.format(digits[:3], digits[3:6], digits[6:])
     elif pollution_type == 'partial_number':
         # Incomplete numbers (common in rushed data entry)
         if random.random() < 0.5:
             # Missing last 1-2 digits
-            digits = digits[:-random.randint(1, 2)]
+            digits = digits[:-_randint(1, 2)]
         else:
             # Missing area code
             digits = digits[3:]
-        return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}" if len(digits) >= 10 else digits
+        return US_PHONE_FORMAT.format(digits[:3], digits[3:6], digits[6:]) if len(digits) >= 10 else digits
     elif pollution_type == 'extra_digits':
         # Extra digits (extension, country code, etc.)
-        extras = ['1', '001', random.choice(['123', '456', '789'])]  # Common extensions
-        digits = random.choice(extras) + digits
+        extras = ['1', '001', _choice(['123', '456', '789'])]  # Common extensions
+        digits = _choice(extras) + digits
         return f"+{digits[:1]} ({digits[1:4]}) {digits[4:7]}-{digits[7:]}"
     elif pollution_type == 'spacing_errors':
         # Inconsistent spacing
@@ -338,62 +713,20 @@ def pollute_address(address: str) -> str:
         return address
     
     # Weighted distribution of address errors
-    pollution_type = random.choices(
-        ['typo', 'abbreviation_variation', 'case_inconsistency', 'spacing_errors', 'number_errors', 'direction_errors'],
-        weights=[0.25, 0.3, 0.15, 0.15, 0.1, 0.05]
-    )[0]
+    pollution_type = _weighted(ADDRESS_POLLUTION_TYPES, ADDRESS_POLLUTION_CUM_WEIGHTS)
     
     if pollution_type == 'typo':
         return introduce_realistic_typos(address, 0.3)
     elif pollution_type == 'abbreviation_variation':
-        # Realistic address abbreviation variations
-        abbrev_variations = {
-            # Street types
-            'Street': ['St', 'St.', 'Str', 'Strt', 'street'],
-            'Avenue': ['Ave', 'Ave.', 'Av', 'Avn', 'avenue'],
-            'Drive': ['Dr', 'Dr.', 'Drv', 'Driv', 'drive'],
-            'Road': ['Rd', 'Rd.', 'Ro', 'road'],
-            'Boulevard': ['Blvd', 'Blvd.', 'Bld', 'Blv', 'boulevard'],
-            'Lane': ['Ln', 'Ln.', 'lane'],
-            'Court': ['Ct', 'Ct.', 'court'],
-            'Place': ['Pl', 'Pl.', 'place'],
-            'Circle': ['Cir', 'Cir.', 'circle'],
-            'Way': ['Wy', 'way'],
-            # Unit types
-            'Apartment': ['Apt', 'Apt.', '#', 'Unit', 'apartment'],
-            'Suite': ['Ste', 'Ste.', '#', 'Su', 'suite'],
-            'Unit': ['Apt', '#', 'unit'],
-            'Building': ['Bldg', 'Bldg.', 'Bld', 'building'],
-            # Directions
-            'North': ['N', 'N.', 'north'],
-            'South': ['S', 'S.', 'south'],
-            'East': ['E', 'E.', 'east'],
-            'West': ['W', 'W.', 'west'],
-            'Northeast': ['NE', 'N.E.', 'northeast'],
-            'Northwest': ['NW', 'N.W.', 'northwest'],
-            'Southeast': ['SE', 'S.E.', 'southeast'],
-            'Southwest': ['SW', 'S.W.', 'southwest']
-        }
-        for full, variations in abbrev_variations.items():
-            if full in address:
-                address = address.replace(full, random.choice(variations))
-                break
-            # Check lowercase version
-            elif full.lower() in address.lower():
-                # Find the actual case in the address and replace
-                pattern = re.compile(re.escape(full), re.IGNORECASE)
-                address = pattern.sub(random.choice(variations), address, 1)
-                break
+        # Realistic address abbreviation variations: one regex pass finds the first
+        # abbreviatable word instead of scanning the address once per table entry
+        match = _ABBREV_RE.search(address)
+        if match:
+            variations = _ABBREV_LOOKUP[match.group().lower()]
+            address = address[:match.start()] + _choice(variations) + address[match.end():]
     elif pollution_type == 'case_inconsistency':
         # Realistic case variations people actually use
-        case_patterns = [
-            str.upper,  # ALL CAPS
-            str.lower,  # all lowercase
-            str.title,  # Title Case
-            lambda x: x.capitalize(),  # First letter only
-            lambda x: ''.join(c.upper() if i == 0 or x[i-1] == ' ' else c.lower() for i, c in enumerate(x))  # Proper case
-        ]
-        address = random.choice(case_patterns)(address)
+        address = _choice(CASE_PATTERNS)(address)
     elif pollution_type == 'spacing_errors':
         # Common spacing mistakes
         if random.random() < 0.4:
@@ -404,26 +737,25 @@ def pollute_address(address: str) -> str:
             address = ' ' + address + ' '  # Extra spaces at ends
     elif pollution_type == 'number_errors':
         # Street number errors
-        numbers = re.findall(r'\d+', address)
+        numbers = _DIGITS_RE.findall(address)
         if numbers:
-            old_num = random.choice(numbers)
+            old_num = _choice(numbers)
             # Common number errors: transpose digits, off by one, etc.
             if len(old_num) > 1 and random.random() < 0.5:
                 # Transpose digits
                 digits = list(old_num)
-                pos = random.randint(0, len(digits) - 2)
+                pos = _randint(0, len(digits) - 2)
                 digits[pos], digits[pos + 1] = digits[pos + 1], digits[pos]
                 new_num = ''.join(digits)
             else:
                 # Off by small amount
-                new_num = str(max(1, int(old_num) + random.randint(-5, 5)))
+                new_num = str(max(1, int(old_num) + _randint(-5, 5)))
             address = address.replace(old_num, new_num, 1)
     elif pollution_type == 'direction_errors':
         # Mix up directions (common in data entry)
-        direction_swaps = {'N': 'S', 'S': 'N', 'E': 'W', 'W': 'E', 'NE': 'NW', 'NW': 'NE', 'SE': 'SW', 'SW': 'SE'}
-        for old_dir, new_dir in direction_swaps.items():
-            if f' {old_dir} ' in address:
-                address = address.replace(f' {old_dir} ', f' {new_dir} ', 1)
+        for old_dir, new_dir in DIRECTION_SWAPS:
+            if old_dir in address:
+                address = address.replace(old_dir, new_dir, 1)
                 break
     
     return address.strip()
@@ -433,42 +765,17 @@ def pollute_name(name: str) -> str:
     if not name:
         return name
     
-    # Weighted distribution of name errors
-    pollution_type = random.choices(
-        ['typo', 'case_variation', 'nickname_substitution', 'initial_variation', 'cultural_variation', 'hyphenation'],
-        weights=[0.25, 0.2, 0.2, 0.15, 0.1, 0.1]
-    )[0]
+    # Weighted distribution of name errors, skipping ones that cannot apply
+    pollution_type = _weighted(*_name_pollution_choices(name))
     
     if pollution_type == 'typo':
         return introduce_realistic_typos(name, 0.25)
     elif pollution_type == 'case_variation':
         # Realistic case patterns for names
-        case_patterns = [
-            str.upper,  # JOHN
-            str.lower,  # john
-            str.title,  # John
-            lambda x: x.capitalize(),  # John (first letter only)
-            lambda x: ''.join(c.upper() if i == 0 or (i > 0 and x[i-1] == ' ') else c.lower() for i, c in enumerate(x))
-        ]
-        return random.choice(case_patterns)(name)
+        return _choice(CASE_PATTERNS)(name)
     elif pollution_type == 'nickname_substitution':
         # Extended nickname mapping based on real usage
-        nickname_map = {
-            'Alexander': ['Alex', 'Xander', 'Al', 'Alec'], 'Alexandra': ['Alex', 'Alexa', 'Sandra', 'Sasha'],
-            'Andrew': ['Andy', 'Drew'], 'Anthony': ['Tony', 'Anton'], 'Benjamin': ['Ben', 'Benny', 'Benji'],
-            'Catherine': ['Cat', 'Cathy', 'Kate', 'Katie'], 'Christopher': ['Chris', 'Christie', 'Topher'],
-            'Daniel': ['Dan', 'Danny'], 'David': ['Dave', 'Davey'], 'Edward': ['Ed', 'Eddie', 'Ted'],
-            'Elizabeth': ['Liz', 'Beth', 'Betty', 'Eliza'], 'Emily': ['Em', 'Emmy'], 'Gregory': ['Greg'],
-            'James': ['Jim', 'Jimmy', 'Jamie'], 'Jennifer': ['Jen', 'Jenny'], 'Jessica': ['Jess', 'Jessie'],
-            'John': ['Johnny', 'Jack'], 'Jonathan': ['Jon', 'Johnny'], 'Joseph': ['Joe', 'Joey'],
-            'Joshua': ['Josh'], 'Kenneth': ['Ken', 'Kenny'], 'Margaret': ['Maggie', 'Meg', 'Peggy'],
-            'Matthew': ['Matt', 'Matty'], 'Michael': ['Mike', 'Mick', 'Mickey'], 'Nicholas': ['Nick', 'Nicky'],
-            'Patricia': ['Pat', 'Patty', 'Tricia'], 'Rebecca': ['Becky', 'Becca'], 'Richard': ['Rick', 'Rich', 'Dick'],
-            'Robert': ['Bob', 'Rob', 'Bobby'], 'Samuel': ['Sam', 'Sammy'], 'Stephen': ['Steve', 'Stevie'],
-            'Susan': ['Sue', 'Susie'], 'Thomas': ['Tom', 'Tommy'], 'William': ['Bill', 'Will', 'Billy']
-        }
-        if name in nickname_map:
-            return random.choice(nickname_map[name])
+        return _choice(NICKNAME_MAP[name])
     elif pollution_type == 'initial_variation':
         # Various initial patterns
         if random.random() < 0.6:
@@ -479,13 +786,7 @@ def pollute_name(name: str) -> str:
             return name[0].lower() + '.'  # j.
     elif pollution_type == 'cultural_variation':
         # Cultural name variations (simplified)
-        cultural_variations = {
-            'John': ['Jon', 'Johan', 'Juan', 'Giovanni'], 'Mary': ['Maria', 'Marie'],
-            'Peter': ['Pedro', 'Pietro'], 'Paul': ['Pablo', 'Paolo'],
-            'Michael': ['Miguel', 'Michele'], 'David': ['Davide']
-        }
-        if name in cultural_variations:
-            return random.choice(cultural_variations[name])
+        return _choice(CULTURAL_NAME_MAP[name])
     elif pollution_type == 'hyphenation':
         # Add or remove hyphens in compound names
         if '-' in name:
@@ -493,30 +794,61 @@ def pollute_name(name: str) -> str:
                 return name.replace('-', ' ')  # Mary-Jane -> Mary Jane
             else:
                 return name.replace('-', '')  # Mary-Jane -> MaryJane
-        elif ' ' in name and len(name.split()) == 2:
+        else:
             return '-'.join(name.split())  # Mary Jane -> Mary-Jane
     
     return name
 
+def are_near_duplicates(a: str, b: str, k: int = 2) -> bool:
+    """Check whether two values are within Levenshtein distance k of each other.
+
+    Intended for matching polluted values back to their originals in duplicate
+    detection; k=2 covers two single-character typos or one transposition.
+    Pairs whose lengths differ by more than k are rejected up front, only the
+    diagonal band of width 2k+1 is evaluated, and the scan stops as soon as a
+    whole row exceeds k, so the cost is O(k * len) rather than O(len(a) * len(b)).
+    """
+    if a == b:
+        return True
+    if abs(len(a) - len(b)) > k:
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+    len_b = len(b)
+    cap = k + 1  # Anything above k is equivalent; cells outside the band stay at cap
+    prev = [j if j <= k else cap for j in range(len_b + 1)]
+    for i, char_a in enumerate(a, 1):
+        cur = [cap] * (len_b + 1)
+        if i <= k:
+            cur[0] = i
+        row_min = cur[0]
+        for j in range(max(1, i - k), min(len_b, i + k) + 1):
+            dist = min(prev[j - 1] + (char_a != b[j - 1]), cur[j - 1] + 1, prev[j] + 1, cap)
+            cur[j] = dist
+            if dist < row_min:
+                row_min = dist
+        if row_min > k:
+            return False
+        prev = cur
+    return prev[len_b] <= k
+
 def generate_product_title() -> str:
     """Generate a product title."""
-    adjective = random.choice(PRODUCT_ADJECTIVES)
-    noun = random.choice(PRODUCT_NOUNS)
-    category = random.choice(PRODUCT_CATEGORIES)
-    
-    patterns = [
-        f"{adjective} {noun}",
-        f"{adjective} {category} {noun}",
-        f"{category} {noun}",
-        f"{adjective} {category}"
-    ]
-    return random.choice(patterns)
+    # Pick the pattern first so only the words it uses are drawn and one string is built
+    pattern = _randint(0, 3)
+    if pattern == 0:
+        return f"{_choice(PRODUCT_ADJECTIVES)} {_choice(PRODUCT_NOUNS)}"
+    if pattern == 1:
+        return f"{_choice(PRODUCT_ADJECTIVES)} {_choice(PRODUCT_CATEGORIES)} {_choice(PRODUCT_NOUNS)}"
+    if pattern == 2:
+        return f"{_choice(PRODUCT_CATEGORIES)} {_choice(PRODUCT_NOUNS)}"
+    return f"{_choice(PRODUCT_ADJECTIVES)} {_choice(PRODUCT_CATEGORIES)}"
 
 def generate_product_description() -> Optional[str]:
     """Generate a product description using Mimesis."""
     if random.random() < 0.2:  # 20% chance of no description
         return None
-    return text.sentence()[:100]  # Limit to 100 characters
+    return _choice(MIMESIS_POOLS['sentence'])[:100]  # Limit to 100 characters
 
 def generate_variant_title(product_title: str) -> str:
     """Generate a variant title based on product title."""
@@ -526,9 +858,9 @@ def generate_variant_title(product_title: str) -> str:
     # Add variant-specific attributes
     attributes = []
     if random.random() < 0.7:
-        attributes.append(random.choice(VARIANT_ATTRIBUTES['color']))
+        attributes.append(_choice(VARIANT_ATTRIBUTES['color']))
     if random.random() < 0.5:
-        attributes.append(random.choice(VARIANT_ATTRIBUTES['size']))
+        attributes.append(_choice(VARIANT_ATTRIBUTES['size']))
     
     if attributes:
         return f"{product_title} - {' / '.join(attributes)}"
@@ -539,167 +871,110 @@ def generate_sku() -> Optional[str]:
     if random.random() < 0.1:  # 10% chance of no SKU
         return None
     
-    letters = ''.join(random.choices('ABCDEFGHIJKLMNOPQRSTUVWXYZ', k=2))
-    numbers = ''.join(random.choices('0123456789', k=4))
-    return f"{letters}-{numbers}"
+    # One draw picks both the letter pair and the 4-digit number
+    letters, number = divmod(int(random.random() * SKU_SPACE), 10_000)
+    return '%s-%04d' % (SKU_LETTER_PAIRS[letters], number)
 
-def generate_variant_attributes() -> Optional[dict]:
-    """Generate variant attributes as JSON (sometimes None)."""
+def generate_variant_attributes() -> Optional[str]:
+    """Generate variant attributes as a JSON object string (sometimes None)."""
     if random.random() < 0.3:  # 30% chance of no attributes
         return None
     
-    attrs = {}
-    for attr_type, values in VARIANT_ATTRIBUTES.items():
-        if random.random() < 0.4:  # 40% chance for each attribute type
-            attrs[attr_type] = random.choice(values)
+    # Same output as json.dumps on the dict, assembled from pre-rendered members
+    members = [_choice(values) for values in VARIANT_ATTRIBUTE_MEMBERS
+               if random.random() < 0.4]  # 40% chance for each attribute type
     
-    return attrs if attrs else None
+    return '{' + ', '.join(members) + '}' if members else None
 
 def generate_image_data() -> Tuple[Optional[str], Optional[str]]:
     """Generate image ID and source URL (sometimes None)."""
     if random.random() < 0.4:  # 40% chance of no image
         return None, None
     
-    image_id = f"img_{random.randint(100000, 999999)}"
+    image_id = f"img_{_randint(100000, 999999)}"
     image_src = f"https://cdn.example.com/products/{image_id}.jpg"
     return image_id, image_src
 
-def generate_price() -> Decimal:
-    """Generate a realistic price."""
-    # Price ranges based on typical e-commerce
-    ranges = [
-        (5, 50),      # 40% - low price items
-        (50, 200),    # 30% - medium price items  
-        (200, 1000),  # 20% - high price items
-        (1000, 5000)  # 10% - premium items
-    ]
-    weights = [0.4, 0.3, 0.2, 0.1]
-    
-    price_range = random.choices(ranges, weights=weights)[0]
-    price = random.uniform(price_range[0], price_range[1])
-    return Decimal(str(price)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-
-def generate_timestamp(start_date: datetime, end_date: datetime) -> str:
-    """Generate a random timestamp between start and end dates."""
-    delta = end_date - start_date
-    random_seconds = random.randint(0, int(delta.total_seconds()))
-    timestamp = start_date + timedelta(seconds=random_seconds)
-    return timestamp.isoformat() + 'Z'
+def generate_price() -> int:
+    """Generate a realistic price in integer cents."""
+    low, high = _weighted(PRICE_RANGES, PRICE_RANGE_CUM_WEIGHTS)
+    return _randint(low * 100, high * 100)
+
+def _random_percent(low: float, high: float) -> int:
+    """Uniform factor in [low, high] rounded to whole percent (e.g. 0.9 -> 90)."""
+    return round(random.uniform(low, high) * 100)
+
+def _round_cents(value: int) -> int:
+    """Round a cents * percent product to whole cents (half to even, like Decimal.quantize)."""
+    cents, rest = divmod(value, 100)
+    if rest > 50 or (rest == 50 and cents & 1):
+        cents += 1
+    return cents
+
+# Timestamps are handled as whole seconds since 0001-01-01 (day ordinal * 86400 + time of day)
+def _to_seconds(dt: datetime) -> int:
+    """Whole seconds of a naive datetime on the proleptic ordinal timeline."""
+    return dt.toordinal() * 86400 + dt.hour * 3600 + dt.minute * 60 + dt.second
+
+@lru_cache(maxsize=None)
+def _iso_date(ordinal: int) -> str:
+    """ISO date for a day ordinal (only a few hundred distinct days ever occur)."""
+    return date.fromordinal(ordinal).isoformat()
+
+def _format_seconds(seconds: int) -> str:
+    """Format ordinal seconds as 'YYYY-MM-DDTHH:MM:SSZ' without building a datetime."""
+    days, rem = divmod(seconds, 86400)
+    hours, rem = divmod(rem, 3600)
+    minutes, secs = divmod(rem, 60)
+    return '%sT%02d:%02d:%02dZ' % (_iso_date(days), hours, minutes, secs)
+
+def _random_seconds(start: int, end: int) -> int:
+    """Random ordinal second in [start, end]."""
+    return start + _randint(0, end - start)
 
 # Removed normalized field generation as per user request
 
 # -------------------- Main Generation Logic --------------------
 def generate_realistic_email(first_name: str, last_name: str) -> str:
     """Generate a realistic email address with proper domain rules."""
-    # Common email domains with their specific rules
-    domains = {
-        'gmail.com': 'gmail',
-        'yahoo.com': 'yahoo',  
-        'hotmail.com': 'outlook',
-        'outlook.com': 'outlook',
-        'aol.com': 'other',
-        'icloud.com': 'other',
-        'protonmail.com': 'other'
-    }
-    
-    domain = random.choice(list(domains.keys()))
-    domain_type = domains[domain]
+    domain = _choice(_DOMAIN_KEYS)
+    domain_type = EMAIL_DOMAINS[domain]
     
     # Clean names for email
-    first_clean = re.sub(r'[^a-zA-Z]', '', first_name.lower())
-    last_clean = re.sub(r'[^a-zA-Z]', '', last_name.lower())
+    first_clean = _NON_ALPHA_RE.sub('', first_name.lower())
+    last_clean = _NON_ALPHA_RE.sub('', last_name.lower())
     
     # Generate base local part
-    patterns = [
-        f"{first_clean}.{last_clean}",
-        f"{first_clean}{last_clean}", 
-        f"{first_clean[0]}.{last_clean}",
-        f"{first_clean}.{last_clean[0]}",
-        f"{first_clean}_{last_clean}",
-        f"{last_clean}.{first_clean}"
-    ]
-    
-    local_part = random.choice(patterns)
+    local_part = _choice(EMAIL_LOCAL_PATTERNS).format(first=first_clean, last=last_clean)
     
     # Add numbers sometimes (realistic pattern)
     if random.random() < 0.4:
-        number_patterns = [
-            str(random.randint(1, 99)),
-            str(random.randint(1980, 2005)),  # Birth years
-            str(random.randint(1, 999))
-        ]
-        local_part += random.choice(number_patterns)
+        local_part += str(_randint(*_choice(EMAIL_NUMBER_RANGES)))
     
     return f"{local_part}@{domain}"
 
 def generate_realistic_phone() -> str:
     """Generate a realistic US phone number with proper formatting."""
     # US phone number format: +1 (XXX) XXX-XXXX
-    # Area codes: avoid 0, 1 in first digit, and some reserved ranges
-    valid_area_codes = [
-        # Major US cities
-        212, 646, 917, 347,  # NYC
-        213, 323, 424, 747,  # LA
-        312, 773, 872,       # Chicago
-        415, 628,            # San Francisco
-        202,                 # Washington DC
-        305, 786,            # Miami
-        404, 678, 470,       # Atlanta
-        617, 857,            # Boston
-        # Other common area codes
-        201, 203, 206, 207, 208, 209, 210, 214, 215, 216, 217, 218, 219,
-        224, 225, 228, 229, 231, 234, 239, 240, 248, 251, 252, 253, 254,
-        256, 260, 262, 267, 269, 270, 276, 281, 301, 302, 303, 304, 307,
-        308, 309, 310, 313, 314, 315, 316, 317, 318, 319, 320, 321, 330,
-        331, 334, 336, 337, 339, 341, 351, 352, 360, 361, 364, 365, 386,
-        401, 402, 403, 405, 406, 407, 408, 409, 410, 412, 413, 414, 417,
-        419, 423, 425, 430, 432, 434, 435, 440, 443, 445, 458, 463, 469,
-        470, 475, 478, 479, 480, 484, 501, 502, 503, 504, 505, 507, 508,
-        509, 510, 512, 513, 515, 516, 517, 518, 520, 530, 540, 541, 551,
-        559, 561, 562, 563, 564, 567, 570, 571, 573, 574, 575, 580, 585,
-        586, 601, 602, 603, 605, 606, 607, 608, 609, 610, 612, 614, 615,
-        616, 618, 619, 620, 623, 626, 630, 631, 636, 641, 646, 650, 651,
-        657, 660, 661, 662, 667, 669, 678, 682, 701, 702, 703, 704, 706,
-        707, 708, 712, 713, 714, 715, 716, 717, 718, 719, 720, 724, 725,
-        727, 731, 732, 734, 737, 740, 743, 747, 754, 757, 760, 762, 763,
-        765, 770, 772, 774, 775, 779, 781, 785, 786, 787, 801, 802, 803,
-        804, 805, 806, 808, 810, 812, 813, 814, 815, 816, 817, 818, 828,
-        830, 831, 832, 835, 843, 845, 847, 848, 850, 856, 857, 858, 859,
-        860, 862, 863, 864, 865, 870, 872, 878, 901, 903, 904, 906, 907,
-        908, 909, 910, 912, 913, 914, 915, 916, 917, 918, 919, 920, 925,
-        928, 929, 930, 931, 934, 936, 937, 940, 941, 947, 949, 951, 952,
-        954, 956, 959, 970, 971, 972, 973, 978, 979, 980, 984, 985, 989
-    ]
-    
-    area_code = random.choice(valid_area_codes)
+    area_code = _choice(VALID_AREA_CODES)
     
     # Exchange code: 2-9 for first digit, 0-9 for second and third
-    exchange = random.randint(200, 999)
+    exchange = _randint(200, 999)
     
     # Last four digits: 0000-9999 (but avoid 0000, 1111, etc.)
     while True:
-        last_four = random.randint(1000, 9999)
+        last_four = _randint(1000, 9999)
         # Avoid patterns like 1111, 2222, etc.
         if len(set(str(last_four))) > 1:
             break
     
-    # Format options (realistic variations)
-    formats = [
-        f"({area_code}) {exchange}-{last_four}",        # Most common
-        f"{area_code}-{exchange}-{last_four}",          # Common
-        f"+1 ({area_code}) {exchange}-{last_four}",     # International
-        f"1-{area_code}-{exchange}-{last_four}",        # With country code
-        f"{area_code}.{exchange}.{last_four}",          # Dot separated
-    ]
-    
-    # Weight towards more common formats
-    weights = [0.5, 0.25, 0.1, 0.1, 0.05]
-    return random.choices(formats, weights=weights)[0]
+    # Pick one of the realistic format variations and fill only that one
+    return _weighted(PHONE_FORMATS, PHONE_FORMAT_CUM_WEIGHTS).format(area_code, exchange, last_four)
 
 def generate_customer_data() -> Dict:
     """Generate customer data using improved generators."""
-    first_name = person.first_name()
-    last_name = person.last_name()
+    first_name = _choice(MIMESIS_POOLS['first_name'])
+    last_name = _choice(MIMESIS_POOLS['last_name'])
     email = generate_realistic_email(first_name, last_name) if random.random() < 0.9 else None
     phone = generate_realistic_phone() if random.random() < 0.7 else None
     
@@ -710,185 +985,180 @@ def generate_customer_data() -> Dict:
         'last_name': last_name
     }
 
-def generate_shipping_data() -> Dict:
-    """Generate shipping address data using Mimesis for higher quality."""
-    first_name = person.first_name()
-    last_name = person.last_name()
+def generate_shipping_data() -> Tuple:
+    """Generate shipping address data using Mimesis for higher quality.
+
+    Values are returned in shipping_* column order (first_name .. country_code).
+    """
+    first_name = _choice(MIMESIS_POOLS['first_name'])
+    last_name = _choice(MIMESIS_POOLS['last_name'])
     
     # Build a complete address
-    street_num = address.street_number()
-    street_name = address.street_name()
-    street_suffix = address.street_suffix()
-    addr1 = f"{street_num} {street_name} {street_suffix}"
-    
-    return {
-        'first_name': first_name,
-        'last_name': last_name,
-        'address_1': addr1,
-        'address_2': f"Apt {random.randint(1, 999)}" if random.random() < 0.3 else None,
-        'city': address.city(),
-        'state': address.state(),
-        'postcode': address.postal_code(),
-        'country_code': address.country_code()
-    }
+    street_num = _randint(1, 1400)
+    street_name = _choice(MIMESIS_POOLS['street_name'])
+    street_suffix = _choice(MIMESIS_POOLS['street_suffix'])
+    addr1 = '%d %s %s' % (street_num, street_name, street_suffix)
+    
+    return (
+        first_name,
+        last_name,
+        addr1,
+        _choice(APARTMENT_NUMBERS) if random.random() < 0.3 else None,  # address_2
+        _choice(MIMESIS_POOLS['city']),
+        _choice(MIMESIS_POOLS['state']),
+        _choice(MIMESIS_POOLS['postal_code']),
+        _choice(MIMESIS_POOLS['country_code'])
+    )
 
-def create_polluted_customer_data(original_customer: Dict) -> Dict:
-    """Create a polluted version of customer data for duplicates."""
-    polluted = original_customer.copy()
+def create_polluted_customer_data(original_customer: Tuple) -> Tuple:
+    """Create a polluted version of the (email, phone_number) customer columns for duplicates."""
+    email, phone_number = original_customer
     
     # Pollute email with high probability
-    if polluted['email'] and random.random() < 0.8:
-        polluted['email'] = pollute_email(polluted['email'])
+    if email and random.random() < 0.8:
+        email = pollute_email(email)
     
     # Pollute phone with medium probability
-    if polluted['phone_number'] and random.random() < 0.6:
-        polluted['phone_number'] = pollute_phone(polluted['phone_number'])
+    if phone_number and random.random() < 0.6:
+        phone_number = pollute_phone(phone_number)
     
-    return polluted
+    return email, phone_number
 
-def create_polluted_shipping_data(original_shipping: Dict) -> Dict:
-    """Create a polluted version of shipping data for duplicates."""
-    polluted = original_shipping.copy()
+def create_polluted_shipping_data(original_shipping: Tuple) -> Tuple:
+    """Create a polluted version of the shipping_* columns for duplicates."""
+    first_name, last_name, address_1, address_2, city, state, postcode, country_code = original_shipping
     
     # Pollute names
     if random.random() < 0.7:
-        polluted['first_name'] = pollute_name(polluted['first_name'])
+        first_name = pollute_name(first_name)
     if random.random() < 0.7:
-        polluted['last_name'] = pollute_name(polluted['last_name'])
+        last_name = pollute_name(last_name)
     
     # Pollute address
     if random.random() < 0.8:
-        polluted['address_1'] = pollute_address(polluted['address_1'])
-    if polluted['address_2'] and random.random() < 0.5:
-        polluted['address_2'] = pollute_address(polluted['address_2'])
+        address_1 = pollute_address(address_1)
+    if address_2 and random.random() < 0.5:
+        address_2 = pollute_address(address_2)
     
     # Pollute city
     if random.random() < 0.4:
-        polluted['city'] = pollute_address(polluted['city'])
+        city = pollute_address(city)
     
-    return polluted
+    return first_name, last_name, address_1, address_2, city, state, postcode, country_code
 
 def generate_order_data(group_order_id: int, start_date: datetime, end_date: datetime) -> Dict:
     """Generate order-level data."""
-    currency = random.choice(CURRENCIES)
-    created_at = generate_timestamp(start_date, end_date)
+    currency = _choice(CURRENCIES)
+    end = _to_seconds(end_date)
+    created = _random_seconds(_to_seconds(start_date), end)
     
     # Updated timestamp should be same or later
-    created_dt = datetime.fromisoformat(created_at.replace('Z', ''))
-    updated_at = generate_timestamp(created_dt, end_date)
+    updated = _random_seconds(created, end)
     
     return {
         'order_external_id': generate_external_id('ORD'),
-        'order_status': random.choice(ORDER_STATUSES),
+        'order_status': _choice(ORDER_STATUSES),
         'order_currency': currency,
-        'order_created_at': created_at,
-        'order_updated_at': updated_at,
+        'order_created_at': _format_seconds(created),
+        'order_updated_at': _format_seconds(updated),
         'client_ip': generate_ip_address()
     }
 
-def generate_product_data() -> Dict:
-    """Generate product data."""
-    title = generate_product_title()
-    
-    return {
-        'product_external_id': generate_external_id('PROD'),
-        'product_title': title,
-        'product_description': generate_product_description(),
-        'product_vendor': random.choice(VENDORS) if random.random() < 0.8 else None,
-        'product_type': random.choice(PRODUCT_CATEGORIES) if random.random() < 0.6 else None
-    }
+def generate_line_item_values(currency: str) -> Tuple:
+    """Generate product, variant and line item data for one line item.
 
-def generate_variant_data(product_title: str) -> Dict:
-    """Generate variant data."""
+    Returns the values positionally, in FIELDNAMES order from product_external_id
+    to line_item_subtotal (amounts in integer cents), ready to splat into a record.
+    """
+    # Product data
+    product_title = generate_product_title()
+    product_external_id = generate_external_id('PROD')
+    product_description = generate_product_description()
+    product_vendor = _choice(VENDORS) if random.random() < 0.8 else None
+    product_type = _choice(PRODUCT_CATEGORIES) if random.random() < 0.6 else None
+    
+    # Variant data
     variant_title = generate_variant_title(product_title)
     image_id, image_src = generate_image_data()
     variant_attrs = generate_variant_attributes()
+    # variant_external_id = generate_external_id('VAR') if random.random() < 0.9 else None
+    variant_external_id = generate_external_id('VAR')
+    variant_sku = generate_sku()
+    variant_price = generate_price()
     
-    return {
-        # 'variant_external_id': generate_external_id('VAR') if random.random() < 0.9 else None,
-        'variant_external_id': generate_external_id('VAR'),
-        'variant_title': variant_title,
-        'variant_sku': generate_sku(),
-        'variant_price': generate_price(),
-        'variant_attributes': json.dumps(variant_attrs) if variant_attrs else None,
-        'variant_image_id': image_id,
-        'variant_image_src': image_src
-    }
-
-def generate_line_item_data(variant_price: Decimal, currency: str) -> Dict:
-    """Generate line item data."""
-    quantity = random.randint(1, DEFAULTS['max_quantity_per_item'])
-    unit_price = variant_price
-    total_price = unit_price * quantity
+    # Line item data
+    quantity = _randint(1, DEFAULTS['max_quantity_per_item'])
+    total_price = variant_price * quantity
     
     # Sometimes have a subtotal (before taxes/shipping)
     subtotal = None
     if random.random() < 0.6:
-        subtotal = total_price * Decimal(random.uniform(0.85, 0.95)).quantize(Decimal('0.01'))
+        subtotal = total_price * _random_percent(0.85, 0.95)  # Cents * percent, written with 4 decimals
     
-    return {
-        'line_item_external_id': generate_external_id('LINE'),
-        'line_item_quantity': quantity,
-        'line_item_unit_price': unit_price,
-        'line_item_total_price': total_price,
-        'line_item_currency': currency,
-        'line_item_subtotal': subtotal
-    }
+    return (
+        product_external_id, product_title, product_description, product_vendor, product_type,
+        variant_external_id, variant_title, variant_sku, variant_price, variant_attrs, image_id, image_src,
+        generate_external_id('LINE'), quantity, variant_price, total_price, currency, subtotal
+    )
 
-def calculate_order_total(line_items: List[Dict]) -> Decimal:
-    """Calculate total order amount from line items."""
-    total = sum(item['line_item_total_price'] for item in line_items)
+def calculate_order_total(line_totals: Iterable[int]) -> int:
+    """Calculate total order amount in cents from the line item totals."""
+    total = sum(line_totals)  # Plain int addition, no Decimal coercion
     # Add some variance for taxes, shipping, etc.
-    variance = Decimal(random.uniform(0.95, 1.15)).quantize(Decimal('0.01'))
-    return (total * variance).quantize(Decimal('0.01'))
+    return _round_cents(total * _random_percent(0.95, 1.15))
 
-def generate_ordered_variants_data(num_orders: int, seed: int = 42) -> List[Dict]:
-    """Generate the main dataset with realistic duplicate patterns."""
+def generate_ordered_variants_data(num_orders: int, seed: int = 42, stats: Optional[Dict] = None,
+                                   order_nums: Optional[range] = None) -> Iterator[Tuple]:
+    """Generate the main dataset with realistic duplicate patterns.
+
+    Records are FIELDNAMES-ordered tuples, yielded one order at a time so the
+    dataset is never held in memory; pass a dict as `stats` to have the summary
+    counters filled in as the generator is consumed. `order_nums` restricts
+    generation to a slice of the num_orders orders (used by parallel workers).
+    """
+    if order_nums is None:
+        order_nums = range(num_orders)
+    if stats is None:
+        stats = {}
+    stats.update(total_records=0, duplicate_records=0, orders=0, duplicate_groups={}, sample_record=None)
     random.seed(seed)
-    fake.seed_instance(seed)
+    # Mimesis providers keep their own generators; seed them too so --seed reproduces every field
+    for provider in (person, address, text):
+        provider.reseed(seed)
+    # Enough distinct values for a few draws per order, capped at MIMESIS_POOL_SIZE; sized from the
+    # whole run (not the slice) so parallel workers build the same pools as a single process
+    build_mimesis_pools(min(MIMESIS_POOL_SIZE, 4 * num_orders + 1))
     
     start_date = datetime(2023, 1, 1)
     end_date = datetime(2024, 12, 31)
     
     # Removed store_ids generation as per user request
     
-    records = []
-    
     # Calculate how many orders should have duplicates (about 10% of orders)
     duplicate_frequency = max(1, num_orders // 10)  # Every 10th order gets duplicates
-    order_count = 0
+    # Order numbers that get duplicates, fixed up front (range membership is O(1))
+    duplicate_order_nums = range(duplicate_frequency - 1, num_orders, duplicate_frequency)
     
-    for order_num in range(num_orders):
-        # Decide if this order should have duplicates
-        should_have_duplicates = (order_num + 1) % duplicate_frequency == 0
-        
-        if should_have_duplicates:
+    for order_num in order_nums:
+        if order_num in duplicate_order_nums:
             # Generate the original order with duplicates
             duplicate_group_id = generate_duplicate_id()
             original_order = generate_single_order(order_num, start_date, end_date, group_order_id=None, duplicate_group_id=duplicate_group_id)
-            records.extend(original_order)
+            _count_order(stats, original_order, duplicate_group_id)
+            yield from original_order
             
             # Generate 2-6 duplicate versions of this order
-            num_duplicates = random.randint(2, 6)
+            num_duplicates = _randint(2, 6)
             
-            # Extract original customer and shipping data for pollution
-            original_customer = {
-                'email': original_order[0]['customer_email'],
-                'phone_number': original_order[0]['customer_phone_number'],
-                'first_name': original_order[0]['customer_email'].split('@')[0] if original_order[0]['customer_email'] else person.first_name(),
-                'last_name': person.last_name()
-            }
-            
-            original_shipping = {
-                'first_name': original_order[0]['shipping_first_name'],
-                'last_name': original_order[0]['shipping_last_name'],
-                'address_1': original_order[0]['shipping_address_1'],
-                'address_2': original_order[0]['shipping_address_2'],
-                'city': original_order[0]['shipping_city'],
-                'state': original_order[0]['shipping_state'],
-                'postcode': original_order[0]['shipping_postcode'],
-                'country_code': original_order[0]['shipping_country_code']
-            }
+            # Keep only what the duplicates reuse: customer and shipping columns for pollution,
+            # and per line item the product/variant columns plus quantity and unit price
+            original_customer = original_order[0][CUSTOMER_SLICE]
+            original_shipping = original_order[0][SHIPPING_SLICE]
+            original_items = [
+                (record[PRODUCT_VARIANT_SLICE], record[LINE_ITEM_QUANTITY], record[LINE_ITEM_UNIT_PRICE])
+                for record in original_order
+            ]
+            del original_order  # Already yielded; don't pin the full records while duplicating
             
             for dup_num in range(num_duplicates):
                 duplicate_order = generate_duplicate_order(
@@ -899,18 +1169,30 @@ def generate_ordered_variants_data(num_orders: int, seed: int = 42) -> List[Dict
                     duplicate_group_id,  # Same duplicate_group_id links them as duplicates
                     original_customer,
                     original_shipping,
-                    original_order
+                    original_items
                 )
-                records.extend(duplicate_order)
+                _count_order(stats, duplicate_order, duplicate_group_id)
+                yield from duplicate_order
         else:
             # Generate a normal order (no duplicates)
             order_records = generate_single_order(order_num, start_date, end_date, group_order_id=None, duplicate_group_id=None)
-            records.extend(order_records)
-    
-    return records
+            _count_order(stats, order_records, None)
+            yield from order_records
+
+def _count_order(stats: Dict, order_records: List[Tuple], duplicate_group_id: Optional[str]):
+    """Update the running summary counters with one generated order."""
+    if stats['sample_record'] is None and order_records:
+        stats['sample_record'] = order_records[0]
+    stats['orders'] += 1
+    stats['total_records'] += len(order_records)
+    if duplicate_group_id is not None:
+        stats['duplicate_records'] += len(order_records)
+        group = stats['duplicate_groups'].setdefault(duplicate_group_id, [0, 0])
+        group[0] += len(order_records)
+        group[1] += 1
 
 def generate_single_order(order_num: int, start_date: datetime, end_date: datetime, 
-                         group_order_id: Optional[str] = None, duplicate_group_id: Optional[str] = None) -> List[Dict]:
+                         group_order_id: Optional[str] = None, duplicate_group_id: Optional[str] = None) -> List[Tuple]:
     """Generate a single order with its line items."""
     # Generate order-level data
     if group_order_id is None:
@@ -921,62 +1203,49 @@ def generate_single_order(order_num: int, start_date: datetime, end_date: dateti
     shipping_data = generate_shipping_data()
     
     # Generate line items for this order
-    num_variants = random.randint(1, DEFAULTS['max_variants_per_order'])
+    num_variants = _randint(1, DEFAULTS['max_variants_per_order'])
     line_items = []
     
     for _ in range(num_variants):
-        product_data = generate_product_data()
-        variant_data = generate_variant_data(product_data['product_title'])
-        line_item_data = generate_line_item_data(
-            variant_data['variant_price'], 
-            order_data['order_currency']
-        )
-        line_items.append({**product_data, **variant_data, **line_item_data})
+        line_items.append(generate_line_item_values(order_data['order_currency']))
     
     # Calculate order total
-    order_total = calculate_order_total(line_items)
-    
-    # Create records for each line item
+    order_total = calculate_order_total(map(line_item_total, line_items))
+    
+    # Columns shared by every line item of this order (store_id .. shipping_country_code)
+    order_values = (
+        STORE_ID,
+        group_order_id,  # Shared group_order_id for all variants in this order
+        order_data['order_external_id'], order_data['order_status'], order_total, order_data['order_currency'],
+        order_data['order_created_at'], order_data['order_updated_at'],
+        customer_data['email'], customer_data['phone_number'], order_data['client_ip'],
+        *shipping_data
+    )
+    
+    # Create records for each line item (row timestamps drawn as integer seconds in the window)
+    start, end = _to_seconds(start_date), _to_seconds(end_date)
     order_records = []
     for line_item in line_items:
-        record = {
-            'id': generate_uuid(),
-            'store_id': '1e27b743-d66d-41a4-8b4e-876b051a5948',  # Static store ID for all rows
-            'created_at': generate_timestamp(start_date, end_date),
-            'updated_at': generate_timestamp(start_date, end_date),
-            'group_order_id': group_order_id,  # Shared group_order_id for all variants in this order
-            'duplicate_group_id': duplicate_group_id,  # Links duplicate orders together
-            
-            # Order data
-            **order_data,
-            'order_total_amount': order_total,
-            
-            # Customer data
-            'customer_email': customer_data['email'],
-            'customer_phone_number': customer_data['phone_number'],
-            
-            # Shipping data (with shipping_ prefix)
-            'shipping_first_name': shipping_data['first_name'],
-            'shipping_last_name': shipping_data['last_name'],
-            'shipping_address_1': shipping_data['address_1'],
-            'shipping_address_2': shipping_data['address_2'],
-            'shipping_city': shipping_data['city'],
-            'shipping_state': shipping_data['state'],
-            'shipping_postcode': shipping_data['postcode'],
-            'shipping_country_code': shipping_data['country_code'],
-            
-            # Product and variant data
-            **line_item
-        }
-        
-        order_records.append(record)
+        record_id = generate_uuid()
+        created_at = _format_seconds(_random_seconds(start, end))
+        updated_at = _format_seconds(_random_seconds(start, end))
+        order_records.append((
+            record_id, *order_values,
+            *line_item,  # Product, variant and line item data
+            created_at, updated_at,
+            duplicate_group_id  # Links duplicate orders together
+        ))
     
     return order_records
 
 def generate_duplicate_order(order_num: int, start_date: datetime, end_date: datetime,
-                           group_order_id: str, duplicate_group_id: str, original_customer: Dict, original_shipping: Dict,
-                           original_order: List[Dict]) -> List[Dict]:
-    """Generate a duplicate order with polluted data."""
+                           group_order_id: str, duplicate_group_id: str, original_customer: Tuple, original_shipping: Tuple,
+                           original_items: List[Tuple]) -> List[Tuple]:
+    """Generate a duplicate order with polluted data.
+
+    original_items holds (product/variant columns, quantity, unit price) for each
+    line item of the original order.
+    """
     # Create polluted customer and shipping data
     polluted_customer = create_polluted_customer_data(original_customer)
     polluted_shipping = create_polluted_shipping_data(original_shipping)
@@ -985,112 +1254,160 @@ def generate_duplicate_order(order_num: int, start_date: datetime, end_date: dat
     order_data = generate_order_data(order_num, start_date, end_date)
     
     # Use same products but potentially different quantities/prices
+    start, end = _to_seconds(start_date), _to_seconds(end_date)
     duplicate_records = []
     
-    for orig_record in original_order:
+    for product_values, new_quantity, unit_price in original_items:
         # Sometimes vary the quantity slightly
-        new_quantity = orig_record['line_item_quantity']
         if random.random() < 0.3:  # 30% chance to vary quantity
-            new_quantity = max(1, new_quantity + random.randint(-1, 2))
+            new_quantity = max(1, new_quantity + _randint(-1, 2))
         
         # Recalculate prices
-        unit_price = orig_record['line_item_unit_price']
         total_price = unit_price * new_quantity
         subtotal = None
         if random.random() < 0.6:
-            subtotal = total_price * Decimal(random.uniform(0.85, 0.95)).quantize(Decimal('0.01'))
+            subtotal = total_price * _random_percent(0.85, 0.95)  # Cents * percent, written with 4 decimals
         
-        record = {
-            'id': generate_uuid(),
-            'store_id': '1e27b743-d66d-41a4-8b4e-876b051a5948',  # Static store ID for all rows
-            'created_at': generate_timestamp(start_date, end_date),
-            'updated_at': generate_timestamp(start_date, end_date),
-            'group_order_id': group_order_id,  # Unique group_order_id for this specific order
-            'duplicate_group_id': duplicate_group_id,  # Links duplicate orders together
-            
+        record_id = generate_uuid()
+        created_at = _format_seconds(_random_seconds(start, end))
+        updated_at = _format_seconds(_random_seconds(start, end))
+        order_total = calculate_order_total((total_price,))
+        
+        duplicate_records.append((
+            record_id, STORE_ID,
+            group_order_id,  # Unique group_order_id for this specific order
             # Order data (new order details)
-            **order_data,
-            'order_total_amount': calculate_order_total([{'line_item_total_price': total_price}]),
-            
-            # Polluted customer data
-            'customer_email': polluted_customer['email'],
-            'customer_phone_number': polluted_customer['phone_number'],
-            
-            # Polluted shipping data
-            'shipping_first_name': polluted_shipping['first_name'],
-            'shipping_last_name': polluted_shipping['last_name'],
-            'shipping_address_1': polluted_shipping['address_1'],
-            'shipping_address_2': polluted_shipping['address_2'],
-            'shipping_city': polluted_shipping['city'],
-            'shipping_state': polluted_shipping['state'],
-            'shipping_postcode': polluted_shipping['postcode'],
-            'shipping_country_code': polluted_shipping['country_code'],
-            
+            order_data['order_external_id'], order_data['order_status'], order_total, order_data['order_currency'],
+            order_data['order_created_at'], order_data['order_updated_at'],
+            # Polluted customer and shipping data
+            *polluted_customer, order_data['client_ip'],
+            *polluted_shipping,
             # Same product data
-            'product_external_id': orig_record['product_external_id'],
-            'product_title': orig_record['product_title'],
-            'product_description': orig_record['product_description'],
-            'product_vendor': orig_record['product_vendor'],
-            'product_type': orig_record['product_type'],
-            'variant_external_id': orig_record['variant_external_id'],
-            'variant_title': orig_record['variant_title'],
-            'variant_sku': orig_record['variant_sku'],
-            'variant_price': orig_record['variant_price'],
-            'variant_attributes': orig_record['variant_attributes'],
-            'variant_image_id': orig_record['variant_image_id'],
-            'variant_image_src': orig_record['variant_image_src'],
-            
+            *product_values,
             # Updated line item data
-            'line_item_external_id': generate_external_id('LINE'),
-            'line_item_quantity': new_quantity,
-            'line_item_unit_price': unit_price,
-            'line_item_total_price': total_price,
-            'line_item_currency': order_data['order_currency'],
-            'line_item_subtotal': subtotal
-        }
-        
-        duplicate_records.append(record)
+            generate_external_id('LINE'), new_quantity, unit_price, total_price, order_data['order_currency'], subtotal,
+            created_at, updated_at,
+            duplicate_group_id  # Links duplicate orders together
+        ))
     
     return duplicate_records
 
 # -------------------- CSV Output --------------------
-def write_csv(records: List[Dict], output_file: str):
-    """Write records to CSV file, filtering out hidden columns."""
-    if not records:
-        print("No records to write!")
-        return
-    
-    all_fieldnames = [
-        'id', 'store_id', 'group_order_id', 'order_external_id', 'order_status', 'order_total_amount', 'order_currency',
-        'order_created_at', 'order_updated_at', 'customer_email', 'customer_phone_number',
-        'client_ip', 'shipping_first_name', 'shipping_last_name', 'shipping_address_1',
-        'shipping_address_2', 'shipping_city', 'shipping_state', 'shipping_postcode',
-        'shipping_country_code', 'product_external_id', 'product_title', 'product_description',
-        'product_vendor', 'product_type', 'variant_external_id', 'variant_title', 'variant_sku',
-        'variant_price', 'variant_attributes', 'variant_image_id', 'variant_image_src',
-        'line_item_external_id', 'line_item_quantity', 'line_item_unit_price',
-        'line_item_total_price', 'line_item_currency', 'line_item_subtotal',
-        'created_at', 'updated_at', 'duplicate_group_id'
-    ]
-    
-    # Filter out hidden columns
-    visible_fieldnames = [field for field in all_fieldnames if field not in hidden_columns_csv]
-    
-    # Filter records to only include visible fields
-    filtered_records = []
-    for record in records:
-        filtered_record = {key: value for key, value in record.items() if key in visible_fieldnames}
-        filtered_records.append(filtered_record)
-    
-    with open(output_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=visible_fieldnames)
-        writer.writeheader()
-        writer.writerows(filtered_records)
-    
+def _visible_fieldnames() -> List[str]:
+    """Output columns: FIELDNAMES without the hidden ones."""
+    return [field for field in FIELDNAMES if field not in hidden_columns_csv]
+
+def _write_rows(f, records: Iterable[Tuple], visible_fieldnames: List[str]) -> int:
+    """Write records as CSV rows (no header) to an open file; returns the number of rows written."""
+    # Pull the visible columns out of each record positionally (itemgetter runs in C)
+    row_values = operator.itemgetter(*(FIELD_INDEX[field] for field in visible_fieldnames))
+    money_columns = [(i, *MONEY_FORMATS[field]) for i, field in enumerate(visible_fieldnames) if field in MONEY_FORMATS]
+    
+    def format_row(record):
+        row = list(row_values(record))
+        for i, unit, fmt in money_columns:
+            if row[i] is not None:
+                row[i] = fmt % divmod(row[i], unit)
+        return row
+    
+    # Rows written in chunks; only flush explicitly when --flush-every is set
+    flush_every = DEFAULTS['flush_every']
+    chunk_rows = flush_every or DEFAULTS['csv_chunk_rows']
+    rows = map(format_row, records)
+    written = 0
+    writer = csv.writer(f)
+    while chunk := list(islice(rows, chunk_rows)):
+        writer.writerows(chunk)
+        written += len(chunk)
+        if flush_every:
+            f.flush()
+    return written
+
+def _format_record(record: Tuple) -> Dict:
+    """Record as a field -> value dict for display, money columns formatted as in the CSV."""
+    row = dict(zip(FIELDNAMES, record))
+    for field, (unit, fmt) in MONEY_FORMATS.items():
+        if row[field] is not None:
+            row[field] = fmt % divmod(row[field], unit)
+    return row
+
+def _report_written(written: int, visible_fieldnames: List[str], output_file: str):
     hidden_count = len(hidden_columns_csv)
     if hidden_count > 0:
         print(f"Hidden {hidden_count} columns: {', '.join(hidden_columns_csv)}")
-    print(f"Generated {len(records)} records with {len(visible_fieldnames)} visible columns and saved to {output_file}")
+    print(f"Generated {written} records with {len(visible_fieldnames)} visible columns and saved to {output_file}")
+
+def write_csv(records: Iterable[Tuple], output_file: str) -> int:
+    """Write records to CSV file, filtering out hidden columns; returns the number of rows written."""
+    records = iter(records)
+    first = next(records, None)
+    if first is None:
+        print("No records to write!")
+        return 0
+    
+    visible_fieldnames = _visible_fieldnames()
+    with open(output_file, 'w', newline='', encoding='utf-8', buffering=DEFAULTS['csv_buffer_size']) as f:
+        csv.writer(f).writerow(visible_fieldnames)
+        written = _write_rows(f, chain((first,), records), visible_fieldnames)
+    
+    _report_written(written, visible_fieldnames, output_file)
+    return written
+
+def _generate_part(args: Tuple) -> Dict:
+    """Worker: generate one slice of the orders into a headerless CSV part file; returns its stats."""
+    num_orders, order_nums, seed, part_file, defaults = args
+    DEFAULTS.update(defaults)  # CLI overrides, for start methods that don't fork
+    stats = {}
+    with open(part_file, 'w', newline='', encoding='utf-8', buffering=DEFAULTS['csv_buffer_size']) as f:
+        _write_rows(f, generate_ordered_variants_data(num_orders, seed, stats, order_nums), _visible_fieldnames())
+    return stats
+
+def write_csv_parallel(num_orders: int, seed: int, output_file: str, workers: int) -> Dict:
+    """Generate and write the dataset with `workers` processes; returns the merged stats.
+
+    The orders are split into one contiguous slice per worker, seeded with
+    seed + slice index, and each worker writes its own part file next to the
+    output. The parts are then concatenated after the header, so no records are
+    pickled between processes. Output is reproducible for a given seed and
+    worker count (the first slice matches a single-process run).
+    """
+    visible_fieldnames = _visible_fieldnames()
+    step = -(-num_orders // workers) if num_orders else 1
+    slices = [range(start, min(start + step, num_orders)) for start in range(0, num_orders, step)]
+    stats = {'total_records': 0, 'duplicate_records': 0, 'orders': 0, 'duplicate_groups': {}, 'sample_record': None}
+    
+    part_dir = tempfile.mkdtemp(prefix='ordered_variants_', dir=os.path.dirname(os.path.abspath(output_file)))
+    try:
+        jobs = [(num_orders, order_nums, seed + i, os.path.join(part_dir, f'part_{i}.csv'), dict(DEFAULTS))
+                for i, order_nums in enumerate(slices)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            part_stats = list(executor.map(_generate_part, jobs))
+        
+        for part in part_stats:
+            for key in ('total_records', 'duplicate_records', 'orders'):
+                stats[key] += part[key]
+            for group_id, (group_records, group_orders) in part['duplicate_groups'].items():
+                group = stats['duplicate_groups'].setdefault(group_id, [0, 0])
+                group[0] += group_records
+                group[1] += group_orders
+            if stats['sample_record'] is None:
+                stats['sample_record'] = part['sample_record']
+        
+        # Like write_csv, leave the output alone when there is nothing to write
+        if not stats['total_records']:
+            print("No records to write!")
+            return stats
+        
+        with open(output_file, 'w', newline='', encoding='utf-8', buffering=DEFAULTS['csv_buffer_size']) as out:
+            csv.writer(out).writerow(visible_fieldnames)
+            for job in jobs:
+                with open(job[3], newline='', encoding='utf-8') as f:
+                    shutil.copyfileobj(f, out, DEFAULTS['csv_buffer_size'])
+    finally:
+        shutil.rmtree(part_dir, ignore_errors=True)
+    
+    _report_written(stats['total_records'], visible_fieldnames, output_file)
+    return stats
 
 # -------------------- CLI --------------------
 def main():
@@ -1105,26 +1422,34 @@ def main():
                        help=f"Max variants per order (default: {DEFAULTS['max_variants_per_order']})")
     parser.add_argument('--max-quantity', type=int, default=DEFAULTS['max_quantity_per_item'],
                        help=f"Max quantity per line item (default: {DEFAULTS['max_quantity_per_item']})")
+    parser.add_argument('--flush-every', type=int, default=DEFAULTS['flush_every'],
+                       help="Flush the output file every N rows (default: only when the file is closed)")
+    parser.add_argument('--workers', type=int, default=DEFAULTS['workers'],
+                       help="Worker processes, each generating a slice of the orders with seed + slice index; "
+                            "0 uses every CPU (default: 1, a single process)")
     
     args = parser.parse_args()
     
     # Update defaults with CLI args
     DEFAULTS['max_variants_per_order'] = args.max_variants
     DEFAULTS['max_quantity_per_item'] = args.max_quantity
+    DEFAULTS['flush_every'] = max(args.flush_every, 0)
     
     print(f"Generating {args.orders} orders with seed {args.seed}...")
-    records = generate_ordered_variants_data(args.orders, args.seed)
-    
-    write_csv(records, args.out)
+    workers = args.workers if args.workers > 0 else os.cpu_count() or 1
+    if workers > 1:
+        stats = write_csv_parallel(args.orders, args.seed, args.out, workers)
+    else:
+        stats = {}
+        write_csv(generate_ordered_variants_data(args.orders, args.seed, stats), args.out)
     
-    # Print summary
-    total_records = len(records)
-    unique_orders = len(set(r['order_external_id'] for r in records))
+    # Print summary (counters were filled in while the records streamed to disk)
+    total_records = stats['total_records']
+    unique_orders = stats['orders']
     avg_variants_per_order = total_records / unique_orders if unique_orders > 0 else 0
     
-    # Count duplicate groups using duplicate_group_id
-    duplicate_groups = len(set(r['duplicate_group_id'] for r in records if r['duplicate_group_id'] is not None))
-    duplicate_records = len([r for r in records if r['duplicate_group_id'] is not None])
+    duplicate_groups = len(stats['duplicate_groups'])
+    duplicate_records = stats['duplicate_records']
     normal_records = total_records - duplicate_records
     
     print(f"Summary:")
@@ -1136,13 +1461,11 @@ def main():
     print(f"  Avg variants per order: {avg_variants_per_order:.1f}")
     
     # Show duplicate group details
-    if duplicate_groups > 0:
-        for dup_group_id in set(r['duplicate_group_id'] for r in records if r['duplicate_group_id'] is not None):
-            group_records = [r for r in records if r['duplicate_group_id'] == dup_group_id]
-            group_orders = len(set(r['order_external_id'] for r in group_records))
-            print(f"  Duplicate group {dup_group_id}: {len(group_records)} records across {group_orders} orders")
+    for dup_group_id, (group_records, group_orders) in stats['duplicate_groups'].items():
+        print(f"  Duplicate group {dup_group_id}: {group_records} records across {group_orders} orders")
     
-    print(f"  Sample record: {records[0] if records else 'None'}")
+    sample_record = stats['sample_record']
+    print(f"  Sample record: {_format_record(sample_record) if sample_record else 'None'}")
 
 if __name__ == "__main__":
     main()
@@ -8,18 +8,24 @@ Uses the 'id' field from the input CSV as 'ordered_variant_id' to establish prop
 
 Usage:
   python generate-returned-variants.py --input test_duplicates_10k.csv --out returned_variants.csv --return-rate 0.15 --seed 42
+
+The generation loop only uses ints, strings, tuples and the random module (money in
+integer cents, one timestamp parse per order), so it also runs under PyPy for large inputs:
+  pypy3 generate-returned-variants.py --input test_duplicates_1m.csv --out returned_variants.csv
 """
 
 import argparse
 import csv
-import json
+import operator
+import os
 import random
-import uuid
+import shutil
+import tempfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from decimal import Decimal, ROUND_HALF_UP
-from typing import Dict, List, Optional, Tuple
-
-from faker import Faker
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 # -------------------- Configuration --------------------
 DEFAULTS = {
@@ -27,11 +33,13 @@ DEFAULTS = {
     'return_rate': 0.15,  # 15% of orders will have returns
     'partial_return_rate': 0.3,  # 30% of returns will be partial
     'input_file': 'datasets/test_duplicates_10k.csv',
-    'output_file': 'returned_variants.csv'
+    'output_file': 'returned_variants.csv',
+    'csv_buffer_size': 1 << 20,  # Input/output file buffer in bytes
+    'workers': 1  # Worker processes for generation (0 = one per CPU)
 }
 
 # -------------------- Data Pools --------------------
-RETURN_REASONS = [
+RETURN_REASONS = (
     'Defective item',
     'Wrong item received',
     'Item not as described',
@@ -52,9 +60,9 @@ RETURN_REASONS = [
     'Better price found elsewhere',
     'No longer needed',
     'Gift return'
-]
+)
 
-REFUNDED_BY_OPTIONS = [
+REFUNDED_BY_OPTIONS = (
     'Customer Service',
     'Auto-refund System',
     'Return Department',
@@ -62,112 +70,190 @@ REFUNDED_BY_OPTIONS = [
     'Support Agent',
     'Quality Assurance',
     'Billing Department'
-]
+)
 
-ORDER_STATUSES_AFTER_RETURN = [
+ORDER_STATUSES_AFTER_RETURN = (
     'partially_returned',
     'fully_returned',
     'return_processed',
     'refunded',
     'cancelled'
-]
+)
+
+# Only delivered, completed, and shipped orders can have returns
+RETURNABLE_STATUSES = frozenset(('delivered', 'completed', 'shipped'))
 
-TAX_CLASSES = [
+# Order statuses a full return can settle in
+FULL_RETURN_STATUSES = ('fully_returned', 'return_processed', 'refunded')
+
+TAX_CLASSES = (
     'standard',
     'reduced',
     'zero',
     'exempt',
     'digital',
     'shipping'
-]
+)
+
+# -------------------- CSV Layout --------------------
+FIELDNAMES = (
+    'id', 'ordered_variant_id', 'group_order_id', 'parent_order_external_id', 'refund_external_id',
+    'refund_date_created', 'refund_amount', 'refund_reason', 'refunded_by',
+    'refunded_payment', 'order_status', 'order_total_amount', 'order_currency',
+    'order_created_at', 'order_updated_at', 'customer_email', 'customer_phone_number',
+    'shipping_first_name', 'shipping_last_name', 'shipping_address_1',
+    'shipping_address_2', 'shipping_city', 'shipping_state', 'shipping_postcode',
+    'shipping_country_code', 'product_external_id', 'product_title',
+    'product_description', 'variant_external_id', 'variant_title', 'variant_sku',
+    'variant_price', 'variant_attributes', 'variant_image_id', 'variant_image_src',
+    'returned_line_item_external_id', 'returned_quantity', 'returned_unit_price',
+    'returned_subtotal', 'returned_subtotal_tax', 'returned_total',
+    'returned_total_tax', 'returned_currency', 'tax_class', 'taxes',
+    'created_at', 'updated_at'
+)
+FIELD_INDEX = {name: i for i, name in enumerate(FIELDNAMES)}
+
+# Customer, shipping, product and variant columns are copied verbatim from the ordered variant
+PASSTHROUGH_FIELDNAMES = FIELDNAMES[FIELD_INDEX['customer_email']:FIELD_INDEX['variant_image_src'] + 1]
 
-# Initialize Faker
-fake = Faker()
+# Ordered variants columns the generator reads; input rows are projected to this order on load
+INPUT_FIELDNAMES = (
+    'id', 'group_order_id', 'order_external_id', 'order_status', 'order_total_amount',
+    'order_currency', 'order_created_at', 'line_item_quantity', 'line_item_unit_price',
+    'line_item_currency'
+) + PASSTHROUGH_FIELDNAMES
+INPUT_INDEX = {name: i for i, name in enumerate(INPUT_FIELDNAMES)}
+
+# Positions within a projected input row
+ORDERED_VARIANT_ID = INPUT_INDEX['id']
+GROUP_ORDER_ID = INPUT_INDEX['group_order_id']
+ORDER_EXTERNAL_ID = INPUT_INDEX['order_external_id']
+ORDER_STATUS = INPUT_INDEX['order_status']
+ORDER_TOTAL_AMOUNT = INPUT_INDEX['order_total_amount']
+ORDER_CURRENCY = INPUT_INDEX['order_currency']
+ORDER_CREATED_AT = INPUT_INDEX['order_created_at']
+LINE_ITEM_QUANTITY = INPUT_INDEX['line_item_quantity']
+LINE_ITEM_UNIT_PRICE = INPUT_INDEX['line_item_unit_price']
+LINE_ITEM_CURRENCY = INPUT_INDEX['line_item_currency']
+PASSTHROUGH_SLICE = slice(INPUT_INDEX[PASSTHROUGH_FIELDNAMES[0]], None)
+
+# Output positions read back for the summary
+REFUND_REASON = FIELD_INDEX['refund_reason']
+REFUNDED_PAYMENT = FIELD_INDEX['refunded_payment']
 
 # -------------------- Helper Functions --------------------
+def _choice(seq):
+    """Uniform pick from a non-empty sequence with a single random.random() draw."""
+    return seq[int(random.random() * len(seq))]
+
+def _randint(low: int, high: int) -> int:
+    """Random integer in [low, high] drawn from a single random.random() call.
+
+    random.randint/random.choice go through randrange/_randbelow on every call,
+    which costs several times more than the draw itself in the per-record path.
+    """
+    return low + int(random.random() * (high - low + 1))
+
+# Version 4 / RFC 4122 variant bits of a 128-bit UUID
+_UUID4_CLEAR_MASK = ~((0xF << 76) | (0x3 << 62)) & ((1 << 128) - 1)
+_UUID4_SET_BITS = (0x4 << 76) | (0x2 << 62)
+
 def generate_uuid() -> str:
-    """Generate a UUID4 string."""
-    return str(uuid.uuid4())
+    """Generate a UUID4-formatted string from the seeded generator.
+
+    Row ids don't need cryptographic randomness, so this skips uuid4's
+    os.urandom call per id and keeps ids reproducible for a given seed.
+    """
+    h = '%032x' % (random.getrandbits(128) & _UUID4_CLEAR_MASK | _UUID4_SET_BITS)
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 def generate_external_id(prefix: str) -> str:
     """Generate an external ID with prefix."""
-    return f"{prefix}_{random.randint(1, 9_999_999)}"
+    return f"{prefix}_{_randint(1, 9_999_999)}"
+
+def parse_timestamp(timestamp: str) -> datetime:
+    """Parse an ISO 8601 'Z' timestamp from the input CSV into a naive datetime."""
+    return datetime.fromisoformat(timestamp.rstrip('Z'))
 
-def generate_timestamp_after(base_timestamp: str, days_range: Tuple[int, int] = (1, 30)) -> str:
-    """Generate a timestamp after the base timestamp."""
-    base_dt = datetime.fromisoformat(base_timestamp.replace('Z', ''))
-    days_after = random.randint(days_range[0], days_range[1])
+def generate_timestamp_after(base_dt: datetime, days_range: Tuple[int, int] = (1, 30)) -> str:
+    """Generate a timestamp a random number of days after the (already parsed) base datetime."""
+    days_after = _randint(days_range[0], days_range[1])
     return_dt = base_dt + timedelta(days=days_after)
     return return_dt.isoformat() + 'Z'
 
-def calculate_tax_amount(subtotal: Decimal, tax_rate: float = 0.08) -> Decimal:
-    """Calculate tax amount based on subtotal."""
-    tax = subtotal * Decimal(str(tax_rate))
-    return tax.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+# Money is carried as integer cents and only formatted when a record is built
+def parse_cents(amount: str) -> int:
+    """Parse a decimal money string (e.g. '12.34') into integer cents."""
+    return int(round(float(amount) * 100))
+
+def format_cents(cents: int) -> str:
+    """Format integer cents as a 2-decimal money string."""
+    return '%d.%02d' % divmod(cents, 100)
+
+def calculate_tax_amount(subtotal: int, tax_rate: float = 0.08) -> int:
+    """Calculate tax amount in cents based on a subtotal in cents (rate taken to 4 decimals, half up)."""
+    return (subtotal * round(tax_rate * 10_000) + 5_000) // 10_000
 
-def generate_taxes_json(subtotal: Decimal, currency: str) -> Optional[str]:
+# One entry of the taxes JSON array, laid out exactly as json.dumps would write it.
+# Titles are fixed, amounts are formatted digits and currencies are ISO codes, so nothing needs escaping.
+TAX_JSON_ENTRY = '{"title": "%s", "rate": %r, "amount": "%s", "currency": "%s"}'
+
+def generate_taxes_json(subtotal: int, currency: str) -> Optional[str]:
     """Generate realistic taxes JSON structure."""
     if random.random() < 0.3:  # 30% chance of no tax data
         return None
     
+    assert currency.isascii() and currency.isalnum(), currency  # Template doesn't escape
     tax_rate = random.uniform(0.05, 0.12)  # 5-12% tax rate
     tax_amount = calculate_tax_amount(subtotal, tax_rate)
-    
-    taxes = [
-        {
-            "title": "Sales Tax",
-            "rate": round(tax_rate, 4),
-            "amount": str(tax_amount),
-            "currency": currency
-        }
-    ]
+    sales_tax = TAX_JSON_ENTRY % ("Sales Tax", round(tax_rate, 4), format_cents(tax_amount), currency)
     
     # Sometimes add additional taxes
     if random.random() < 0.2:
         additional_rate = random.uniform(0.01, 0.03)
         additional_amount = calculate_tax_amount(subtotal, additional_rate)
-        taxes.append({
-            "title": "City Tax",
-            "rate": round(additional_rate, 4),
-            "amount": str(additional_amount),
-            "currency": currency
-        })
+        city_tax = TAX_JSON_ENTRY % ("City Tax", round(additional_rate, 4), format_cents(additional_amount), currency)
+        return f'[{sales_tax}, {city_tax}]'
     
-    return json.dumps(taxes)
+    return f'[{sales_tax}]'
 
 # -------------------- Return Data Generation --------------------
 def should_return_order(order_status: str) -> bool:
     """Determine if an order should have returns based on its status."""
-    # Only delivered, completed, and shipped orders can have returns
-    returnable_statuses = ['delivered', 'completed', 'shipped']
-    return order_status in returnable_statuses
+    return order_status in RETURNABLE_STATUSES
 
-def generate_return_data(original_record: Dict, return_date: str) -> Dict:
-    """Generate return-specific data for a returned item."""
+def generate_return_data(original_record: Tuple, return_date: str,
+                         partial_return_rate: float = DEFAULTS['partial_return_rate']) -> Tuple[bool, Tuple, Tuple]:
+    """Generate return-specific data for a returned item.
+    
+    Returns whether the return is partial, the refund columns (refund_external_id ..
+    refunded_payment) and the returned_* columns (returned_line_item_external_id ..
+    taxes), each in FIELDNAMES order.
+    """
+    rand = random.random  # Called up to 6 times per item; bind once
     # Determine return quantity (partial or full)
-    original_quantity = int(original_record['line_item_quantity'])
+    original_quantity = int(original_record[LINE_ITEM_QUANTITY])
     
     # 30% chance of partial return, otherwise full return
-    if random.random() < DEFAULTS['partial_return_rate'] and original_quantity > 1:
-        returned_quantity = random.randint(1, original_quantity - 1)
+    if rand() < partial_return_rate and original_quantity > 1:
+        returned_quantity = _randint(1, original_quantity - 1)
     else:
         returned_quantity = original_quantity
     
-    # Calculate return amounts
-    unit_price = Decimal(str(original_record['line_item_unit_price']))
+    # Calculate return amounts in cents
+    unit_price = parse_cents(original_record[LINE_ITEM_UNIT_PRICE])
     returned_subtotal = unit_price * returned_quantity
     
-    # Sometimes apply a restocking fee or partial refund
-    refund_percentage = 1.0
-    if random.random() < 0.1:  # 10% chance of partial refund
-        refund_percentage = random.uniform(0.7, 0.95)
+    # Sometimes apply a restocking fee or partial refund (uniform whole percent 70-95, amount rounded half up)
+    if rand() < 0.1:  # 10% chance of partial refund
+        refund_percentage = _randint(70, 95)
+        returned_subtotal = (returned_subtotal * refund_percentage + 50) // 100
     
-    returned_subtotal_after_fees = returned_subtotal * Decimal(str(refund_percentage))
-    returned_subtotal_after_fees = returned_subtotal_after_fees.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+    returned_subtotal_after_fees = format_cents(returned_subtotal)
     
     # Calculate taxes (commented out - return amount calculated without tax)
-    # returned_subtotal_tax = calculate_tax_amount(returned_subtotal_after_fees) if random.random() < 0.7 else None
-    # returned_total = returned_subtotal_after_fees + (returned_subtotal_tax or Decimal('0'))
+    # returned_subtotal_tax = calculate_tax_amount(returned_subtotal) if rand() < 0.7 else None
+    # returned_total = format_cents(returned_subtotal + (returned_subtotal_tax or 0))
     # returned_total_tax = returned_subtotal_tax
     
     # Return amount based only on item total price (no tax)
@@ -176,30 +262,33 @@ def generate_return_data(original_record: Dict, return_date: str) -> Dict:
     returned_total_tax = None
     
     # Generate refund data
-    refund_external_id = generate_external_id('REF') if random.random() < 0.9 else None
-    refund_amount = returned_total if random.random() < 0.95 else None
-    refunded_payment = random.choice([True, False]) if random.random() < 0.8 else False
+    refund_external_id = generate_external_id('REF') if rand() < 0.9 else None
+    refund_amount = returned_total if rand() < 0.95 else None
+    refunded_payment = rand() < 0.4  # 80% eligible x 50% refunded, folded into one draw
     
-    return {
-        'refund_external_id': refund_external_id,
-        'refund_date_created': return_date,
-        'refund_amount': refund_amount,
-        'refund_reason': random.choice(RETURN_REASONS),
-        'refunded_by': random.choice(REFUNDED_BY_OPTIONS) if random.random() < 0.8 else None,
-        'refunded_payment': refunded_payment,
-        'returned_line_item_external_id': generate_external_id('RETLINE'),
-        'returned_quantity': returned_quantity,
-        'returned_unit_price': unit_price,
-        'returned_subtotal': returned_subtotal_after_fees,
-        'returned_subtotal_tax': returned_subtotal_tax,
-        'returned_total': returned_total,
-        'returned_total_tax': returned_total_tax,
-        'returned_currency': original_record['line_item_currency'],
-        'tax_class': None,  # Commented out tax calculations
-        'taxes': None  # Commented out tax calculations
-        # 'tax_class': random.choice(TAX_CLASSES) if random.random() < 0.6 else None,
-        # 'taxes': generate_taxes_json(returned_subtotal_after_fees, original_record['line_item_currency'])
-    }
+    refund_values = (
+        refund_external_id,
+        return_date,  # refund_date_created
+        refund_amount,
+        _choice(RETURN_REASONS),  # refund_reason
+        _choice(REFUNDED_BY_OPTIONS) if rand() < 0.8 else None,  # refunded_by
+        refunded_payment
+    )
+    returned_values = (
+        generate_external_id('RETLINE'),  # returned_line_item_external_id
+        returned_quantity,
+        original_record[LINE_ITEM_UNIT_PRICE],  # returned_unit_price, passed through as written
+        returned_subtotal_after_fees,
+        returned_subtotal_tax,
+        returned_total,
+        returned_total_tax,
+        original_record[LINE_ITEM_CURRENCY],  # returned_currency
+        None,  # tax_class: commented out tax calculations
+        None  # taxes: commented out tax calculations
+        # random.choice(TAX_CLASSES) if rand() < 0.6 else None,
+        # generate_taxes_json(returned_subtotal, original_record[LINE_ITEM_CURRENCY])
+    )
+    return returned_quantity < original_quantity, refund_values, returned_values
 
 def update_order_status_for_return(original_status: str, is_partial_return: bool) -> str:
     """Update order status based on return type."""
@@ -207,143 +296,214 @@ def update_order_status_for_return(original_status: str, is_partial_return: bool
         return 'partially_returned'
     else:
         # For full returns, choose an appropriate status
-        return random.choice(['fully_returned', 'return_processed', 'refunded'])
+        return _choice(FULL_RETURN_STATUSES)
 
-def process_ordered_variants_file(input_file: str, return_rate: float, seed: int) -> List[Dict]:
-    """Process the ordered variants CSV and generate returns."""
-    random.seed(seed)
-    fake.seed_instance(seed)
+def iter_ordered_variants(input_file: str) -> Iterator[List[Tuple]]:
+    """Stream the returnable orders of the ordered variants CSV, one list of INPUT_FIELDNAMES tuples per order.
     
-    returned_records = []
+    Line items are grouped by consecutive order_external_id, so each order's rows must
+    be contiguous in the input (as generate-ordered-variants.py writes them); only one
+    order is held in memory at a time. Rows whose order status can never produce a
+    return are dropped while reading, so they are neither projected nor grouped.
+    """
+    orders = 0
+    line_items = 0
+    with open(input_file, 'r', newline='', encoding='utf-8', buffering=DEFAULTS['csv_buffer_size']) as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        idx = {name: i for i, name in enumerate(header)}
+        # Keep only the columns we need, as positional tuples
+        project = operator.itemgetter(*(idx[name] for name in INPUT_FIELDNAMES))
+        status_col = idx['order_status']
+        order_id_col = idx['order_external_id']
+        
+        # Group records by order_external_id to handle returns at order level
+        current_order_id = None
+        order_records = []
+        for row in reader:
+            line_items += 1
+            if row[status_col] not in RETURNABLE_STATUSES:
+                continue
+            order_id = row[order_id_col]
+            if order_id != current_order_id:
+                if order_records:
+                    orders += 1
+                    yield order_records
+                current_order_id = order_id
+                order_records = []
+            order_records.append(project(row))
+        if order_records:
+            orders += 1
+            yield order_records
     
-    # Read the input CSV
-    with open(input_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        records = list(reader)
+    print(f"Processed {orders} returnable orders from {line_items} line items")
+
+def read_ordered_variants(input_file: str) -> List[List[Tuple]]:
+    """Read every returnable order of the ordered variants CSV into memory (to split across workers)."""
+    return list(iter_ordered_variants(input_file))
+
+def generate_returned_variants_data(orders: Iterable[List[Tuple]], return_rate: float, seed: int,
+                                    stats: Optional[Dict] = None) -> Iterator[Tuple]:
+    """Yield returned variant records for the given order groups as they are generated.
     
-    # Group records by order_external_id to handle returns at order level
-    orders = {}
-    for record in records:
-        order_id = record['order_external_id']
-        if order_id not in orders:
-            orders[order_id] = []
-        orders[order_id].append(record)
+    Records are streamed so output never accumulates in memory; pass a dict as
+    `stats` to have the summary counters filled in while the records are consumed.
+    """
+    random.seed(seed)
     
-    print(f"Processing {len(orders)} unique orders from {len(records)} line items...")
+    if stats is None:
+        stats = {}
+    stats.update(total_records=0, partial_returns=0, refunded_payment=0, returned_orders=set(),
+                 reason_counts=Counter(), sample_record=None)
+    returned_orders = stats['returned_orders']
+    reason_counts = stats['reason_counts']
+    # Per-order/per-item callables as locals (LOAD_FAST instead of global + attribute lookups)
+    rand = random.random
+    sample = random.sample
+    make_return_data = generate_return_data
+    new_uuid = generate_uuid
+    order_status_for_return = update_order_status_for_return
+    partial_return_rate = DEFAULTS['partial_return_rate']
     
     # Process each order for potential returns
-    for order_id, order_records in orders.items():
+    for order_records in orders:
         # Check if this order should have returns
-        if not should_return_order(order_records[0]['order_status']):
+        if not should_return_order(order_records[0][ORDER_STATUS]):
             continue
             
-        if random.random() > return_rate:
+        if rand() > return_rate:
             continue
         
         # Determine return date (after order creation)
-        order_created = order_records[0]['order_created_at']
+        order_created = parse_timestamp(order_records[0][ORDER_CREATED_AT])
         return_date = generate_timestamp_after(order_created, (3, 60))  # 3-60 days after order
         
         # Decide which items to return (can be partial)
         items_to_return = order_records.copy()
         
         # Sometimes only return some items from the order
-        if len(items_to_return) > 1 and random.random() < 0.4:
-            num_items_to_return = random.randint(1, len(items_to_return))
-            items_to_return = random.sample(items_to_return, num_items_to_return)
+        if len(items_to_return) > 1 and rand() < 0.4:
+            num_items_to_return = _randint(1, len(items_to_return))
+            items_to_return = sample(items_to_return, num_items_to_return)
+        
+        returned_orders.add(order_records[0][ORDER_EXTERNAL_ID])
         
         # Generate return records for selected items
         for original_record in items_to_return:
-            return_data = generate_return_data(original_record, return_date)
+            is_partial_return, refund_values, returned_values = make_return_data(original_record, return_date, partial_return_rate)
             
-            # Check if this is a partial return
-            is_partial_return = return_data['returned_quantity'] < int(original_record['line_item_quantity'])
+            # Create the returned variant record, in FIELDNAMES order
+            returned_record = (
+                new_uuid(),
+                original_record[ORDERED_VARIANT_ID],  # Foreign key to original ordered_variants record
+                original_record[GROUP_ORDER_ID],  # Copy group_order_id from input
+                original_record[ORDER_EXTERNAL_ID],
+                *refund_values,
+                order_status_for_return(original_record[ORDER_STATUS], is_partial_return),
+                original_record[ORDER_TOTAL_AMOUNT],
+                original_record[ORDER_CURRENCY],
+                original_record[ORDER_CREATED_AT],
+                return_date,  # order_updated_at: updated when returned
+                *original_record[PASSTHROUGH_SLICE],
+                *returned_values,
+                return_date,
+                return_date
+            )
             
-            # Create the returned variant record
-            returned_record = {
-                'id': generate_uuid(),
-                'ordered_variant_id': original_record['id'],  # Foreign key to original ordered_variants record
-                'group_order_id': original_record['group_order_id'],  # Copy group_order_id from input
-                'parent_order_external_id': original_record['order_external_id'],
-                'refund_external_id': return_data['refund_external_id'],
-                'refund_date_created': return_data['refund_date_created'],
-                'refund_amount': return_data['refund_amount'],
-                'refund_reason': return_data['refund_reason'],
-                'refunded_by': return_data['refunded_by'],
-                'refunded_payment': return_data['refunded_payment'],
-                'order_status': update_order_status_for_return(original_record['order_status'], is_partial_return),
-                'order_total_amount': original_record['order_total_amount'],
-                'order_currency': original_record['order_currency'],
-                'order_created_at': original_record['order_created_at'],
-                'order_updated_at': return_data['refund_date_created'],  # Updated when returned
-                'customer_email': original_record['customer_email'],
-                'customer_phone_number': original_record['customer_phone_number'],
-                'shipping_first_name': original_record['shipping_first_name'],
-                'shipping_last_name': original_record['shipping_last_name'],
-                'shipping_address_1': original_record['shipping_address_1'],
-                'shipping_address_2': original_record['shipping_address_2'],
-                'shipping_city': original_record['shipping_city'],
-                'shipping_state': original_record['shipping_state'],
-                'shipping_postcode': original_record['shipping_postcode'],
-                'shipping_country_code': original_record['shipping_country_code'],
-                'product_external_id': original_record['product_external_id'],
-                'product_title': original_record['product_title'],
-                'product_description': original_record['product_description'],
-                'variant_external_id': original_record['variant_external_id'],
-                'variant_title': original_record['variant_title'],
-                'variant_sku': original_record['variant_sku'],
-                'variant_price': original_record['variant_price'],
-                'variant_attributes': original_record['variant_attributes'],
-                'variant_image_id': original_record['variant_image_id'],
-                'variant_image_src': original_record['variant_image_src'],
-                'returned_line_item_external_id': return_data['returned_line_item_external_id'],
-                'returned_quantity': return_data['returned_quantity'],
-                'returned_unit_price': return_data['returned_unit_price'],
-                'returned_subtotal': return_data['returned_subtotal'],
-                'returned_subtotal_tax': return_data['returned_subtotal_tax'],
-                'returned_total': return_data['returned_total'],
-                'returned_total_tax': return_data['returned_total_tax'],
-                'returned_currency': return_data['returned_currency'],
-                'tax_class': return_data['tax_class'],
-                'taxes': return_data['taxes'],
-                'created_at': return_date,
-                'updated_at': return_date
-            }
+            if stats['sample_record'] is None:
+                stats['sample_record'] = returned_record
+            stats['total_records'] += 1
+            stats['partial_returns'] += is_partial_return
+            stats['refunded_payment'] += returned_record[REFUNDED_PAYMENT]
+            reason_counts[returned_record[REFUND_REASON]] += 1
             
-            returned_records.append(returned_record)
-    
-    return returned_records
+            yield returned_record
+
+def process_ordered_variants_file(input_file: str, return_rate: float, seed: int,
+                                  stats: Optional[Dict] = None) -> Iterator[Tuple]:
+    """Process the ordered variants CSV and yield returned variant records as they are generated."""
+    return generate_returned_variants_data(iter_ordered_variants(input_file), return_rate, seed, stats)
 
 # -------------------- CSV Output --------------------
-def write_csv(records: List[Dict], output_file: str):
-    """Write returned variants records to CSV file."""
-    if not records:
+def _write_rows(f, records: Iterable[Tuple]) -> int:
+    """Write records as CSV rows (no header) to an open file; returns the number of rows written."""
+    writer = csv.writer(f)
+    written = 0
+    for record in records:
+        writer.writerow(record)
+        written += 1
+    return written
+
+def write_csv(records: Iterable[Tuple], output_file: str) -> int:
+    """Write returned variants records to CSV file; returns the number of rows written."""
+    records = iter(records)
+    first = next(records, None)
+    if first is None:
         print("No returned variant records to write!")
-        return
+        return 0
     
-    # Define fieldnames based on the updated schema
-    fieldnames = [
-        'id', 'ordered_variant_id', 'group_order_id', 'parent_order_external_id', 'refund_external_id', 
-        'refund_date_created', 'refund_amount', 'refund_reason', 'refunded_by', 
-        'refunded_payment', 'order_status', 'order_total_amount', 'order_currency', 
-        'order_created_at', 'order_updated_at', 'customer_email', 'customer_phone_number',
-        'shipping_first_name', 'shipping_last_name', 'shipping_address_1',
-        'shipping_address_2', 'shipping_city', 'shipping_state', 'shipping_postcode',
-        'shipping_country_code', 'product_external_id', 'product_title',
-        'product_description', 'variant_external_id', 'variant_title', 'variant_sku',
-        'variant_price', 'variant_attributes', 'variant_image_id', 'variant_image_src',
-        'returned_line_item_external_id', 'returned_quantity', 'returned_unit_price',
-        'returned_subtotal', 'returned_subtotal_tax', 'returned_total',
-        'returned_total_tax', 'returned_currency', 'tax_class', 'taxes',
-        'created_at', 'updated_at'
-    ]
+    with open(output_file, 'w', newline='', encoding='utf-8', buffering=DEFAULTS['csv_buffer_size']) as f:
+        csv.writer(f).writerow(FIELDNAMES)
+        written = _write_rows(f, chain((first,), records))
     
-    with open(output_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(records)
+    print(f"Generated {written} returned variant records and saved to {output_file}")
+    return written
+
+def _generate_part(args: Tuple) -> Dict:
+    """Worker: generate returns for one slice of the orders into a headerless CSV part file; returns its stats."""
+    orders, return_rate, seed, part_file = args
+    stats = {}
+    with open(part_file, 'w', newline='', encoding='utf-8', buffering=DEFAULTS['csv_buffer_size']) as f:
+        _write_rows(f, generate_returned_variants_data(orders, return_rate, seed, stats))
+    return stats
+
+def write_csv_parallel(input_file: str, return_rate: float, seed: int, output_file: str, workers: int) -> Dict:
+    """Generate and write the returned variants with `workers` processes; returns the merged stats.
+
+    The input is read and grouped once here, then the orders are split into one
+    contiguous slice per worker, seeded with seed + slice index. Each worker
+    writes its own part file next to the output and the parts are concatenated
+    after the header, so only the input rows are pickled between processes.
+    Output is reproducible for a given seed and worker count (the first slice
+    matches a single-process run).
+    """
+    orders = read_ordered_variants(input_file)
+    step = -(-len(orders) // workers) if orders else 1
+    slices = [orders[start:start + step] for start in range(0, len(orders), step)]
+    stats = {'total_records': 0, 'partial_returns': 0, 'refunded_payment': 0, 'returned_orders': set(),
+             'reason_counts': Counter(), 'sample_record': None}
+    
+    part_dir = tempfile.mkdtemp(prefix='returned_variants_', dir=os.path.dirname(os.path.abspath(output_file)))
+    try:
+        jobs = [(order_slice, return_rate, seed + i, os.path.join(part_dir, f'part_{i}.csv'))
+                for i, order_slice in enumerate(slices)]
+        del orders, slices
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            part_stats = list(executor.map(_generate_part, jobs))
+        
+        for part in part_stats:
+            for key in ('total_records', 'partial_returns', 'refunded_payment'):
+                stats[key] += part[key]
+            stats['returned_orders'] |= part['returned_orders']
+            stats['reason_counts'].update(part['reason_counts'])
+            if stats['sample_record'] is None:
+                stats['sample_record'] = part['sample_record']
+        
+        # Like write_csv, leave the output alone when there is nothing to write
+        if not stats['total_records']:
+            print("No returned variant records to write!")
+            return stats
+        
+        with open(output_file, 'w', newline='', encoding='utf-8', buffering=DEFAULTS['csv_buffer_size']) as out:
+            csv.writer(out).writerow(FIELDNAMES)
+            for job in jobs:
+                with open(job[3], newline='', encoding='utf-8') as f:
+                    shutil.copyfileobj(f, out, DEFAULTS['csv_buffer_size'])
+    finally:
+        shutil.rmtree(part_dir, ignore_errors=True)
     
-    print(f"Generated {len(records)} returned variant records and saved to {output_file}")
+    print(f"Generated {stats['total_records']} returned variant records and saved to {output_file}")
+    return stats
 
 # -------------------- CLI --------------------
 def main():
@@ -356,6 +516,9 @@ def main():
                        help=f"Return rate (0.0-1.0) (default: {DEFAULTS['return_rate']})")
     parser.add_argument('--seed', type=int, default=DEFAULTS['seed'],
                        help=f"Random seed (default: {DEFAULTS['seed']})")
+    parser.add_argument('--workers', type=int, default=DEFAULTS['workers'],
+                       help="Worker processes, each generating returns for a slice of the orders with seed + slice index; "
+                            "0 uses every CPU (default: 1, a single process)")
     
     args = parser.parse_args()
     
@@ -367,39 +530,33 @@ def main():
     print(f"Processing {args.input} with {args.return_rate:.1%} return rate and seed {args.seed}...")
     
     try:
-        returned_records = process_ordered_variants_file(args.input, args.return_rate, args.seed)
-        write_csv(returned_records, args.out)
+        workers = args.workers if args.workers > 0 else os.cpu_count() or 1
+        if workers > 1:
+            stats = write_csv_parallel(args.input, args.return_rate, args.seed, args.out, workers)
+        else:
+            stats = {}
+            write_csv(process_ordered_variants_file(args.input, args.return_rate, args.seed, stats), args.out)
         
         # Print summary
+        total_records = stats['total_records']
         print(f"\nSummary:")
-        print(f"  Total returned variant records: {len(returned_records)}")
+        print(f"  Total returned variant records: {total_records}")
         
-        if returned_records:
-            # Count unique orders with returns
-            unique_returned_orders = len(set(r['parent_order_external_id'] for r in returned_records))
-            print(f"  Unique orders with returns: {unique_returned_orders}")
-            
-            # Count refund statistics
-            refunded_records = len([r for r in returned_records if r['refunded_payment']])
-            print(f"  Records with payment refunded: {refunded_records}")
+        if total_records:
+            print(f"  Unique orders with returns: {len(stats['returned_orders'])}")
+            print(f"  Records with payment refunded: {stats['refunded_payment']}")
             
             # Count partial vs full returns
-            partial_returns = len([r for r in returned_records if r['order_status'] == 'partially_returned'])
-            full_returns = len(returned_records) - partial_returns
+            partial_returns = stats['partial_returns']
             print(f"  Partial returns: {partial_returns}")
-            print(f"  Full returns: {full_returns}")
+            print(f"  Full returns: {total_records - partial_returns}")
             
             # Show return reasons distribution
-            reason_counts = {}
-            for record in returned_records:
-                reason = record['refund_reason']
-                reason_counts[reason] = reason_counts.get(reason, 0) + 1
-            
             print(f"  Top return reasons:")
-            for reason, count in sorted(reason_counts.items(), key=lambda x: x[1], reverse=True)[:5]:
+            for reason, count in stats['reason_counts'].most_common(5):
                 print(f"    {reason}: {count}")
             
-            print(f"\n  Sample record: {returned_records[0]}")
+            print(f"\n  Sample record: {dict(zip(FIELDNAMES, stats['sample_record']))}")
     
     except FileNotFoundError:
         print(f"Error: Input file '{args.input}' not found!")
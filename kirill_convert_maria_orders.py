@@ -1,16 +1,20 @@
+import numpy as np
 import pandas as pd
 import os
 import sys
-import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
-import random
 
 # Set UTF-8 encoding for Windows console
 if sys.platform == "win32":
     import codecs
     sys.stdout = codecs.getwriter("utf-8")(sys.stdout.detach())
 
+# Narrower dtypes for the integer count columns (pandas would infer int64); columns a file
+# doesn't have are ignored. Prices stay float64 so the exported amounts are unchanged.
+CSV_DTYPES = {'quantity': 'int32', 'quantity_refunded': 'int32'}
+
 def read_all_csv_files():
     """Read all CSV files from maria_script folder organized by type"""
     maria_script_path = Path("maria_script")
@@ -28,109 +32,94 @@ def read_all_csv_files():
     # File suffixes (A, B, C, D)
     suffixes = ['A', 'B', 'C', 'D']
     
-    for suffix in suffixes:
-        print(f"Reading files with suffix {suffix}...")
+    # Start all 24 reads at once; pandas releases the GIL while reading and parsing,
+    # so the files overlap in a thread pool
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {
+            (kind, suffix): executor.submit(pd.read_csv, maria_script_path / f"{kind}_{suffix}.csv", dtype=CSV_DTYPES)
+            for suffix in suffixes for kind in data
+        }
         
-        # Read each type of CSV file
-        try:
-            data['line_items'][suffix] = pd.read_csv(maria_script_path / f"line_items_{suffix}.csv")
-            data['orders'][suffix] = pd.read_csv(maria_script_path / f"orders_{suffix}.csv")
-            data['customers'][suffix] = pd.read_csv(maria_script_path / f"customers_{suffix}.csv")
-            data['products'][suffix] = pd.read_csv(maria_script_path / f"products_{suffix}.csv")
-            data['variants'][suffix] = pd.read_csv(maria_script_path / f"variants_{suffix}.csv")
-            data['refunds'][suffix] = pd.read_csv(maria_script_path / f"refunds_{suffix}.csv")
-            print(f"  Successfully loaded all {suffix} files")
-        except Exception as e:
-            print(f"  Error loading {suffix} files: {e}")
+        for suffix in suffixes:
+            print(f"Reading files with suffix {suffix}...")
+            
+            # Collect each type of CSV file
+            try:
+                for kind in data:
+                    data[kind][suffix] = futures[kind, suffix].result()
+                print(f"  Successfully loaded all {suffix} files")
+            except Exception as e:
+                print(f"  Error loading {suffix} files: {e}")
     
     return data
 
-def create_mappings(data):
-    """Create mapping dictionaries for quick lookups"""
-    mappings = {
-        'order_to_customer': {},
-        'variant_to_product': {},
-        'line_item_to_order': {},
-        'line_item_to_variant': {},
-        'refund_to_line_item': {},
-        'refund_to_order': {}
-    }
-    
+def build_lookup_indexes(data):
+    """Index the datasets once by their lookup keys so the tracer probes a hash index instead of scanning"""
     suffixes = ['A', 'B', 'C', 'D']
-    
-    for suffix in suffixes:
-        # Map orders to customers
-        orders_df = data['orders'][suffix]
-        for _, row in orders_df.iterrows():
-            mappings['order_to_customer'][row['order_id']] = row['customer_id']
-        
-        # Map variants to products
-        variants_df = data['variants'][suffix]
-        for _, row in variants_df.iterrows():
-            mappings['variant_to_product'][row['variant_id']] = row['product_id']
-        
-        # Map line items to orders and variants
-        line_items_df = data['line_items'][suffix]
-        for _, row in line_items_df.iterrows():
-            mappings['line_item_to_order'][row['line_item_id']] = row['order_id']
-            mappings['line_item_to_variant'][row['line_item_id']] = row['variant_id']
-        
-        # Map refunds to line items and orders
-        refunds_df = data['refunds'][suffix]
-        for _, row in refunds_df.iterrows():
-            mappings['refund_to_line_item'][row['refund_id']] = row['line_item_id']
-            mappings['refund_to_order'][row['refund_id']] = row['order_id']
-    
-    return mappings
+    # (name, dataset, key, first_only): first_only keeps the first row per key (some exports repeat
+    # line_item_id) so .loc returns a single row; the others are multi-row lookups
+    index_keys = [
+        ('line_items', 'line_items', 'line_item_id', True),
+        ('order_line_items', 'line_items', 'order_id', False),
+        ('orders', 'orders', 'order_id', True),
+        ('customers', 'customers', 'customer_id', True),
+        ('variants', 'variants', 'variant_id', True),
+        ('products', 'products', 'product_id', True),
+        ('refunds', 'refunds', 'line_item_id', False),
+    ]
+    indexes = {}
+    for name, kind, key, first_only in index_keys:
+        indexes[name] = {}
+        for suffix in suffixes:
+            df = data[kind][suffix]
+            if first_only:
+                df = df[~df[key].duplicated()]
+            # drop=False keeps the key as a column so the looked-up rows print as before
+            indexes[name][suffix] = df.set_index(key, drop=False)
+    return indexes
 
-def convert_order_id_to_uuid(order_id):
-    """Convert order ID like 'A_O1' or 'D_O123' to UUID format like '00000000-0000-0000-0000-a00000000001'"""
-    # Extract the letter (A, B, C, D) and make it lowercase
-    letter = order_id[0].lower()
-    
-    # Extract all digits from the order ID
-    digits = ''.join(filter(str.isdigit, order_id))
-    
-    # Ensure we don't exceed the 12-character limit for the last part
-    # Format: letter + up to 11 digits (padded with zeros if needed)
-    if len(digits) > 11:
-        # If more than 11 digits, take the last 11
-        digits = digits[-11:]
-    
-    # Create the UUID suffix: letter + digits padded to 12 characters total
-    uuid_suffix = letter + digits.zfill(11)
-    
-    # Create the full UUID
-    uuid_result = f"00000000-0000-0000-0000-{uuid_suffix}"
-    
-    return uuid_result
+def convert_order_ids_to_uuids(order_ids):
+    """Convert order IDs like 'A_O1' or 'D_O123' to UUIDs like '00000000-0000-0000-0000-a00000000001'
 
-def convert_date_to_datetime_with_timezone(date_str):
-    """Convert date string to datetime with timezone for PostgreSQL compatibility"""
-    try:
-        # Parse the date (assuming format like '2024-02-06')
-        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-        
-        # Add random time component (between 00:00:00 and 23:59:59)
-        hour = random.randint(0, 23)
-        minute = random.randint(0, 59)
-        second = random.randint(0, 59)
-        
-        # Create datetime with time component
-        datetime_obj = date_obj.replace(hour=hour, minute=minute, second=second)
-        
-        # Add UTC timezone
-        datetime_with_tz = datetime_obj.replace(tzinfo=timezone.utc)
-        
-        # Return in ISO format with timezone
-        return datetime_with_tz.isoformat()
-        
-    except ValueError:
-        # If parsing fails, return current datetime with timezone
-        return datetime.now(timezone.utc).isoformat()
+    The last UUID group is the lowercased letter plus the ID's digits, keeping the last 11 and zero-padded to 11.
+    """
+    letters = order_ids.str[0].str.lower()
+    digits = order_ids.str.replace(r'\D', '', regex=True).str[-11:].str.zfill(11)
+    return '00000000-0000-0000-0000-' + letters + digits
+
+def split_customer_names(names):
+    """Split customer names into (first, last) Series, skipping a leading title ("First Last" or "Title First Last")"""
+    # Collapse whitespace so the pattern sees single-space separated words
+    words = names.str.replace(r'\s+', ' ', regex=True).str.strip()
+    # An optional leading title ending in '.' (like "Univ.Prof."), then the first name and the rest
+    parts = words.str.extract(r'^(?:\S+\. )?(\S+)(?: (.*))?$')
+    # Single-word (or empty) names are kept whole as the first name
+    single_word = ~words.str.contains(' ', regex=False)
+    first_names = parts[0].where(~single_word, names)
+    last_names = parts[1].fillna('').where(~single_word, '')
+    return first_names, last_names
 
-def export_all_line_items_to_csv(data, mappings, output_file="kirill_convert_maria_ordered_variants.csv"):
-    """Export all line items with related data to CSV file"""
+def random_uuids(count):
+    """Generate `count` UUID4 strings from a single os.urandom call"""
+    raw = np.frombuffer(os.urandom(16 * count), dtype=np.uint8).reshape(count, 16).copy()
+    # Set the version 4 and RFC 4122 variant bits, as uuid.uuid4() does
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80
+    h = raw.tobytes().hex()
+    return [f"{h[i:i + 8]}-{h[i + 8:i + 12]}-{h[i + 12:i + 16]}-{h[i + 16:i + 20]}-{h[i + 20:i + 32]}"
+            for i in range(0, 32 * count, 32)]
+
+def random_datetimes_with_timezone(dates, rng):
+    """Add a random time of day to parsed dates and format them as UTC ISO datetimes for PostgreSQL
+
+    Like '2024-02-06T13:04:05+00:00'; dates that failed to parse (NaT) get the current datetime instead.
+    """
+    seconds = pd.to_timedelta(rng.integers(0, 86400, len(dates)), unit='s')
+    datetimes = (dates + seconds).dt.strftime('%Y-%m-%dT%H:%M:%S+00:00')
+    return datetimes.fillna(datetime.now(timezone.utc).isoformat())
+
+def export_all_line_items_to_csv(data, output_file="kirill_convert_maria_ordered_variants.csv"):
+    """Export all line items with related data to CSV file (joins the frames directly)"""
     print(f"Exporting all line items to {output_file}...")
     
     # Define the CSV headers as specified
@@ -150,8 +139,21 @@ def export_all_line_items_to_csv(data, mappings, output_file="kirill_convert_mar
     # Store ID as specified
     store_id = '1e27b743-d66d-41a4-8b4e-876b051a5948'
     
-    # List to store all rows
-    all_rows = []
+    # Columns joined onto each line item (customers and products also carry address/date columns we don't use)
+    order_columns = ['order_id', 'customer_id', 'order_date', 'status', 'street', 'city', 'postal_code',
+                     'country', 'total_amount']
+    customer_columns = ['customer_id', 'name', 'email']
+    variant_columns = ['variant_id', 'product_id', 'color', 'size', 'sku', 'price']
+    product_columns = ['product_id', 'product_name', 'category']
+    
+    # Each dataset's rows are written as soon as they are built, so only one dataset is held in memory
+    total_rows = 0
+    
+    # Random time-of-day offsets for the order timestamps
+    rng = np.random.default_rng()
+    
+    # Get current timestamp with timezone (one export run, one created_at/updated_at)
+    current_time = datetime.now(timezone.utc).isoformat()
     
     # Process each dataset (A, B, C, D)
     suffixes = ['A', 'B', 'C', 'D']
@@ -159,122 +161,85 @@ def export_all_line_items_to_csv(data, mappings, output_file="kirill_convert_mar
     for suffix in suffixes:
         print(f"  Processing dataset {suffix}...")
         
-        line_items_df = data['line_items'][suffix]
-        orders_df = data['orders'][suffix]
-        customers_df = data['customers'][suffix]
-        products_df = data['products'][suffix]
-        variants_df = data['variants'][suffix]
+        # Join every line item to its order, customer, variant and product in one pass
+        # (left joins keep the line item order; each key must be unique on the right side)
+        line_items = (
+            data['line_items'][suffix]
+            .merge(data['orders'][suffix][order_columns], on='order_id', how='left', validate='many_to_one')
+            .merge(data['customers'][suffix][customer_columns], on='customer_id', how='left', validate='many_to_one')
+            .merge(data['variants'][suffix][variant_columns], on='variant_id', how='left', validate='many_to_one')
+            .merge(data['products'][suffix][product_columns], on='product_id', how='left', validate='many_to_one')
+        )
         
-        # Create lookup dictionaries for faster access
-        orders_dict = orders_df.set_index('order_id').to_dict('index')
-        customers_dict = customers_df.set_index('customer_id').to_dict('index')
-        products_dict = products_df.set_index('product_id').to_dict('index')
-        variants_dict = variants_df.set_index('variant_id').to_dict('index')
+        # Calculate prices (subtotal is the same as total after discount)
+        unit_price = line_items['price']
+        total_price = (unit_price * line_items['quantity'] - line_items['discount']).clip(lower=0)
         
-        # Process each line item
-        for _, line_item in line_items_df.iterrows():
-            # Get related data
-            order_id = line_item['order_id']
-            variant_id = line_item['variant_id']
-            
-            order = orders_dict[order_id]
-            customer_id = order['customer_id']
-            customer = customers_dict[customer_id]
-            variant = variants_dict[variant_id]
-            product_id = variant['product_id']
-            product = products_dict[product_id]
-            
-            # Calculate prices
-            unit_price = variant['price']
-            quantity = line_item['quantity']
-            discount = line_item['discount']
-            total_price = (unit_price * quantity) - discount
-            if total_price < 0:
-                total_price = 0
-            subtotal = total_price  # Assuming subtotal is same as total after discount
-            
-            # Parse customer name (assuming format: "First Last" or "Title First Last")
-            name_parts = customer['name'].split()
-            if len(name_parts) >= 2:
-                # Handle titles like "Univ.Prof."
-                if name_parts[0].endswith('.'):
-                    first_name = name_parts[1] if len(name_parts) > 1 else name_parts[0]
-                    last_name = ' '.join(name_parts[2:]) if len(name_parts) > 2 else ''
-                else:
-                    first_name = name_parts[0]
-                    last_name = ' '.join(name_parts[1:])
-            else:
-                first_name = customer['name']
-                last_name = ''
-            
-            # Create variant attributes string
-            variant_attributes = f"Color: {variant['color']}, Size: {variant['size']}"
-            
-            # Get current timestamp with timezone
-            current_time = datetime.now(timezone.utc).isoformat()
-            
-            # Convert order dates to datetime with timezone
-            order_created_datetime = convert_date_to_datetime_with_timezone(order['order_date'])
-            order_updated_datetime = convert_date_to_datetime_with_timezone(order['order_date'])
-            
-            # Create row data
-            row = {
-                'id': str(uuid.uuid4()),
-                'store_id': store_id,
-                'group_order_id': convert_order_id_to_uuid(order_id),
-                'order_external_id': order_id,
-                'order_status': order['status'],
-                'order_total_amount': order['total_amount'],
-                'order_currency': 'EUR',  # Assuming EUR based on European addresses
-                'order_created_at': order_created_datetime,
-                'order_updated_at': order_updated_datetime,
-                'customer_email': customer['email'],
-                'customer_phone_number': '',  # Not available in source data
-                'client_ip': '',  # Not available in source data
-                'shipping_first_name': first_name,
-                'shipping_last_name': last_name,
-                'shipping_address_1': order['street'],
-                'shipping_address_2': '',  # Not available in source data
-                'shipping_city': order['city'],
-                'shipping_state': '',  # Not available in source data
-                'shipping_postcode': order['postal_code'],
-                'shipping_country_code': order['country'][:2].upper() if len(order['country']) > 2 else order['country'].upper(),
-                'product_external_id': product_id,
-                'product_title': product['product_name'],
-                'product_description': f"{product['category']} product",
-                'product_vendor': 'Default Vendor',  # Not available in source data
-                'product_type': product['category'],
-                'variant_external_id': variant_id,
-                'variant_title': f"{product['product_name']} - {variant['color']} - {variant['size']}",
-                'variant_sku': variant['sku'],
-                'variant_price': variant['price'],
-                'variant_attributes': variant_attributes,
-                'variant_image_id': '',  # Not available in source data
-                'variant_image_src': '',  # Not available in source data
-                'line_item_external_id': line_item['line_item_id'],
-                'line_item_quantity': quantity,
-                'line_item_unit_price': unit_price,
-                'line_item_total_price': total_price,
-                'line_item_currency': 'EUR',
-                'line_item_subtotal': subtotal,
-                'created_at': current_time,
-                'updated_at': current_time
-            }
-            
-            all_rows.append(row)
-    
-    # Create DataFrame and export to CSV
-    df = pd.DataFrame(all_rows, columns=headers)
-    df.to_csv(output_file, index=False, encoding='utf-8')
+        # Parse customer names
+        first_names, last_names = split_customer_names(line_items['name'])
+        
+        # Convert order dates to datetimes with timezone (parsed once, separate random times for created/updated)
+        order_dates = pd.to_datetime(line_items['order_date'], format='%Y-%m-%d', errors='coerce')
+        
+        df = pd.DataFrame({
+            'id': random_uuids(len(line_items)),
+            'store_id': store_id,
+            'group_order_id': convert_order_ids_to_uuids(line_items['order_id']),
+            'order_external_id': line_items['order_id'],
+            'order_status': line_items['status'],
+            'order_total_amount': line_items['total_amount'],
+            'order_currency': 'EUR',  # Assuming EUR based on European addresses
+            'order_created_at': random_datetimes_with_timezone(order_dates, rng),
+            'order_updated_at': random_datetimes_with_timezone(order_dates, rng),
+            'customer_email': line_items['email'],
+            'customer_phone_number': '',  # Not available in source data
+            'client_ip': '',  # Not available in source data
+            'shipping_first_name': first_names,
+            'shipping_last_name': last_names,
+            'shipping_address_1': line_items['street'],
+            'shipping_address_2': '',  # Not available in source data
+            'shipping_city': line_items['city'],
+            'shipping_state': '',  # Not available in source data
+            'shipping_postcode': line_items['postal_code'],
+            'shipping_country_code': line_items['country'].str[:2].str.upper(),
+            'product_external_id': line_items['product_id'],
+            'product_title': line_items['product_name'],
+            'product_description': line_items['category'] + ' product',
+            'product_vendor': 'Default Vendor',  # Not available in source data
+            'product_type': line_items['category'],
+            'variant_external_id': line_items['variant_id'],
+            'variant_title': line_items['product_name'] + ' - ' + line_items['color'] + ' - ' + line_items['size'],
+            'variant_sku': line_items['sku'],
+            'variant_price': unit_price,
+            'variant_attributes': 'Color: ' + line_items['color'] + ', Size: ' + line_items['size'],
+            'variant_image_id': '',  # Not available in source data
+            'variant_image_src': '',  # Not available in source data
+            'line_item_external_id': line_items['line_item_id'],
+            'line_item_quantity': line_items['quantity'],
+            'line_item_unit_price': unit_price,
+            'line_item_total_price': total_price,
+            'line_item_currency': 'EUR',
+            'line_item_subtotal': total_price,
+            'created_at': current_time,
+            'updated_at': current_time
+        }, columns=headers)
+        
+        # Export to CSV: the first dataset creates the file with the header, the rest append
+        first_dataset = suffix == suffixes[0]
+        df.to_csv(output_file, index=False, encoding='utf-8', mode='w' if first_dataset else 'a', header=first_dataset)
+        total_rows += len(df)
     
-    print(f"✓ Successfully exported {len(all_rows)} line items to {output_file}")
+    print(f"✓ Successfully exported {total_rows} line items to {output_file}")
     print(f"  Total datasets processed: {len(suffixes)}")
     print(f"  File size: {os.path.getsize(output_file) / 1024:.1f} KB")
     
-    return df
+    return total_rows
+
+def find_all_data_for_line_item(line_item_id, indexes):
+    """Find all connected data for a specific line item
 
-def find_all_data_for_line_item(line_item_id, data, mappings):
-    """Find all connected data for a specific line item"""
+    indexes comes from build_lookup_indexes(data); build it once and reuse it for every trace.
+    """
     print(f"\n{'='*60}")
     print(f"TRACING ALL DATA CONNECTED TO LINE ITEM: {line_item_id}")
     print(f"{'='*60}")
@@ -283,14 +248,13 @@ def find_all_data_for_line_item(line_item_id, data, mappings):
     suffix = line_item_id.split('_')[0]  # Extract 'A', 'B', 'C', or 'D'
     
     # 1. Get the line item itself
-    line_items_df = data['line_items'][suffix]
-    line_item = line_items_df[line_items_df['line_item_id'] == line_item_id]
+    line_items_df = indexes['line_items'][suffix]
     
-    if line_item.empty:
+    if line_item_id not in line_items_df.index:
         print(f"ERROR: Line item {line_item_id} not found!")
         return
     
-    line_item_row = line_item.iloc[0]
+    line_item_row = line_items_df.loc[line_item_id]
     print(f"\nLINE ITEM:")
     print(f"  ID: {line_item_row['line_item_id']}")
     print(f"  Order ID: {line_item_row['order_id']}")
@@ -300,8 +264,7 @@ def find_all_data_for_line_item(line_item_id, data, mappings):
     
     # 2. Get the order
     order_id = line_item_row['order_id']
-    orders_df = data['orders'][suffix]
-    order = orders_df[orders_df['order_id'] == order_id].iloc[0]
+    order = indexes['orders'][suffix].loc[order_id]
     
     print(f"\nORDER:")
     print(f"  ID: {order['order_id']}")
@@ -314,8 +277,7 @@ def find_all_data_for_line_item(line_item_id, data, mappings):
     
     # 3. Get the customer
     customer_id = order['customer_id']
-    customers_df = data['customers'][suffix]
-    customer = customers_df[customers_df['customer_id'] == customer_id].iloc[0]
+    customer = indexes['customers'][suffix].loc[customer_id]
     
     print(f"\nCUSTOMER:")
     print(f"  ID: {customer['customer_id']}")
@@ -327,8 +289,7 @@ def find_all_data_for_line_item(line_item_id, data, mappings):
     
     # 4. Get the variant
     variant_id = line_item_row['variant_id']
-    variants_df = data['variants'][suffix]
-    variant = variants_df[variants_df['variant_id'] == variant_id].iloc[0]
+    variant = indexes['variants'][suffix].loc[variant_id]
     
     print(f"\nVARIANT:")
     print(f"  ID: {variant['variant_id']}")
@@ -340,8 +301,7 @@ def find_all_data_for_line_item(line_item_id, data, mappings):
     
     # 5. Get the product
     product_id = variant['product_id']
-    products_df = data['products'][suffix]
-    product = products_df[products_df['product_id'] == product_id].iloc[0]
+    product = indexes['products'][suffix].loc[product_id]
     
     print(f"\nPRODUCT:")
     print(f"  ID: {product['product_id']}")
@@ -351,8 +311,11 @@ def find_all_data_for_line_item(line_item_id, data, mappings):
     print(f"  Created At: {product['created_at']}")
     
     # 6. Check for refunds
-    refunds_df = data['refunds'][suffix]
-    related_refunds = refunds_df[refunds_df['line_item_id'] == line_item_id]
+    refunds_by_line_item = indexes['refunds'][suffix]
+    if line_item_id in refunds_by_line_item.index:
+        related_refunds = refunds_by_line_item.loc[[line_item_id]]
+    else:
+        related_refunds = refunds_by_line_item.iloc[:0]
     
     if not related_refunds.empty:
         print(f"\nREFUNDS:")
@@ -367,10 +330,8 @@ def find_all_data_for_line_item(line_item_id, data, mappings):
         print(f"\nREFUNDS: None")
     
     # 7. Show other line items in the same order
-    other_line_items = line_items_df[
-        (line_items_df['order_id'] == order_id) & 
-        (line_items_df['line_item_id'] != line_item_id)
-    ]
+    order_line_items = indexes['order_line_items'][suffix].loc[[order_id]]
+    other_line_items = order_line_items[order_line_items['line_item_id'] != line_item_id]
     
     if not other_line_items.empty:
         print(f"\nOTHER LINE ITEMS IN SAME ORDER:")
@@ -385,10 +346,6 @@ def main():
     # Read all CSV files
     data = read_all_csv_files()
     
-    # Create mappings
-    print("\nCreating relationship mappings...")
-    mappings = create_mappings(data)
-    
     # Show some statistics
     print(f"\nDATA SUMMARY:")
     total_line_items = 0
@@ -410,20 +367,22 @@ def main():
     print("EXPORTING TO CSV")
     print("="*60)
     
-    exported_df = export_all_line_items_to_csv(data, mappings)
+    total_records = export_all_line_items_to_csv(data)
+    preview_df = pd.read_csv("kirill_convert_maria_ordered_variants.csv", nrows=5)
     
     print("\n" + "="*60)
     print("EXPORT COMPLETED!")
     print("="*60)
     print(f"File: kirill_convert_maria_ordered_variants.csv")
-    print(f"Total records: {len(exported_df)}")
-    print(f"Columns: {len(exported_df.columns)}")
+    print(f"Total records: {total_records}")
+    print(f"Columns: {len(preview_df.columns)}")
     print("\nFirst few rows preview:")
-    print(exported_df[['id', 'order_external_id', 'customer_email', 'product_title', 'variant_sku', 'line_item_quantity']].head())
+    print(preview_df[['id', 'order_external_id', 'customer_email', 'product_title', 'variant_sku', 'line_item_quantity']].head())
     
     # Optional: Show example of how to trace specific line items
     print(f"\nTo trace any specific line item, you can still call:")
-    print("find_all_data_for_line_item('LINE_ITEM_ID', data, mappings)")
+    print("indexes = build_lookup_indexes(data)  # once")
+    print("find_all_data_for_line_item('LINE_ITEM_ID', indexes)")
     print("Examples: 'A_L5', 'B_L10', 'C_L25', 'D_L100'")
 
 if __name__ == "__main__":
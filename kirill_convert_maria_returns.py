@@ -1,17 +1,32 @@
+import numpy as np
 import pandas as pd
 import os
 import sys
 import uuid
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
-import random
 
 # Set UTF-8 encoding for Windows console
 if sys.platform == "win32":
     import codecs
     sys.stdout = codecs.getwriter("utf-8")(sys.stdout.detach())
 
+# Narrower dtypes for the integer count columns (pandas would infer int64); columns a file
+# doesn't have are ignored. Prices stay float64 so the exported amounts are unchanged.
+CSV_DTYPES = {'quantity': 'int32', 'quantity_refunded': 'int32'}
+
+# Ordered variants CSV column -> refund-side column for the ordered variant lookup
+ORDERED_VARIANT_LOOKUP_COLUMNS = {
+    'order_external_id': 'order_id',
+    'line_item_external_id': 'line_item_id',
+    'variant_external_id': 'variant_id',
+    'product_external_id': 'product_id',
+    'id': 'ordered_variant_id'
+}
+ORDERED_VARIANT_KEY = ['order_id', 'line_item_id', 'variant_id', 'product_id']
+
 def read_all_csv_files():
     """Read all CSV files from maria_script folder organized by type"""
     maria_script_path = Path("maria_script")
@@ -29,142 +44,75 @@ def read_all_csv_files():
     # File suffixes (A, B, C, D)
     suffixes = ['A', 'B', 'C', 'D']
     
-    for suffix in suffixes:
-        print(f"Reading files with suffix {suffix}...")
+    # Start all 24 reads at once; pandas releases the GIL while reading and parsing,
+    # so the files overlap in a thread pool
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {
+            (kind, suffix): executor.submit(pd.read_csv, maria_script_path / f"{kind}_{suffix}.csv", dtype=CSV_DTYPES)
+            for suffix in suffixes for kind in data
+        }
         
-        # Read each type of CSV file
-        try:
-            data['line_items'][suffix] = pd.read_csv(maria_script_path / f"line_items_{suffix}.csv")
-            data['orders'][suffix] = pd.read_csv(maria_script_path / f"orders_{suffix}.csv")
-            data['customers'][suffix] = pd.read_csv(maria_script_path / f"customers_{suffix}.csv")
-            data['products'][suffix] = pd.read_csv(maria_script_path / f"products_{suffix}.csv")
-            data['variants'][suffix] = pd.read_csv(maria_script_path / f"variants_{suffix}.csv")
-            data['refunds'][suffix] = pd.read_csv(maria_script_path / f"refunds_{suffix}.csv")
-            print(f"  Successfully loaded all {suffix} files")
-        except Exception as e:
-            print(f"  Error loading {suffix} files: {e}")
+        for suffix in suffixes:
+            print(f"Reading files with suffix {suffix}...")
+            
+            # Collect each type of CSV file
+            try:
+                for kind in data:
+                    data[kind][suffix] = futures[kind, suffix].result()
+                print(f"  Successfully loaded all {suffix} files")
+            except Exception as e:
+                print(f"  Error loading {suffix} files: {e}")
     
     return data
 
-def create_mappings(data):
-    """Create mapping dictionaries for quick lookups"""
-    mappings = {
-        'order_to_customer': {},
-        'variant_to_product': {},
-        'line_item_to_order': {},
-        'line_item_to_variant': {},
-        'refund_to_line_item': {},
-        'refund_to_order': {}
-    }
-    
-    suffixes = ['A', 'B', 'C', 'D']
-    
-    for suffix in suffixes:
-        # Map orders to customers
-        orders_df = data['orders'][suffix]
-        for _, row in orders_df.iterrows():
-            mappings['order_to_customer'][row['order_id']] = row['customer_id']
-        
-        # Map variants to products
-        variants_df = data['variants'][suffix]
-        for _, row in variants_df.iterrows():
-            mappings['variant_to_product'][row['variant_id']] = row['product_id']
-        
-        # Map line items to orders and variants
-        line_items_df = data['line_items'][suffix]
-        for _, row in line_items_df.iterrows():
-            mappings['line_item_to_order'][row['line_item_id']] = row['order_id']
-            mappings['line_item_to_variant'][row['line_item_id']] = row['variant_id']
-        
-        # Map refunds to line items and orders
-        refunds_df = data['refunds'][suffix]
-        for _, row in refunds_df.iterrows():
-            mappings['refund_to_line_item'][row['refund_id']] = row['line_item_id']
-            mappings['refund_to_order'][row['refund_id']] = row['order_id']
-    
-    return mappings
+def convert_order_ids_to_uuids(order_ids):
+    """Convert order IDs like 'A_O1' or 'D_O123' to UUIDs like '00000000-0000-0000-0000-a00000000001'
 
-def convert_order_id_to_uuid(order_id):
-    """Convert order ID like 'A_O1' or 'D_O123' to UUID format like '00000000-0000-0000-0000-a00000000001'"""
-    # Extract the letter (A, B, C, D) and make it lowercase
-    letter = order_id[0].lower()
-    
-    # Extract all digits from the order ID
-    digits = ''.join(filter(str.isdigit, order_id))
-    
-    # Ensure we don't exceed the 12-character limit for the last part
-    # Format: letter + up to 11 digits (padded with zeros if needed)
-    if len(digits) > 11:
-        # If more than 11 digits, take the last 11
-        digits = digits[-11:]
-    
-    # Create the UUID suffix: letter + digits padded to 12 characters total
-    uuid_suffix = letter + digits.zfill(11)
-    
-    # Create the full UUID
-    uuid_result = f"00000000-0000-0000-0000-{uuid_suffix}"
-    
-    return uuid_result
+    The last UUID group is the lowercased letter plus the ID's digits, keeping the last 11 and zero-padded to 11.
+    """
+    letters = order_ids.str[0].str.lower()
+    digits = order_ids.str.replace(r'\D', '', regex=True).str[-11:].str.zfill(11)
+    return '00000000-0000-0000-0000-' + letters + digits
+
+def split_customer_names(names):
+    """Split customer names into (first, last) Series, skipping a leading title ("First Last" or "Title First Last")"""
+    # Collapse whitespace so the pattern sees single-space separated words
+    words = names.str.replace(r'\s+', ' ', regex=True).str.strip()
+    # An optional leading title ending in '.' (like "Univ.Prof."), then the first name and the rest
+    parts = words.str.extract(r'^(?:\S+\. )?(\S+)(?: (.*))?$')
+    # Single-word (or empty) names are kept whole as the first name
+    single_word = ~words.str.contains(' ', regex=False)
+    first_names = parts[0].where(~single_word, names)
+    last_names = parts[1].fillna('').where(~single_word, '')
+    return first_names, last_names
 
 def load_ordered_variants_lookup():
-    """Load the ordered variants CSV and create a lookup dictionary"""
+    """Load the ordered variants CSV as a lookup frame to merge refunds against"""
     ordered_variants_file = "kirill_convert_maria_ordered_variants.csv"
     
     if not os.path.exists(ordered_variants_file):
         raise FileNotFoundError(f"Required file {ordered_variants_file} not found. Please run kirill_convert_maria.py first.")
     
     print(f"Loading ordered variants lookup from {ordered_variants_file}...")
-    df = pd.read_csv(ordered_variants_file)
-    
-    # Create lookup dictionary using composite key
-    # Key: (order_external_id, line_item_external_id, variant_external_id, product_external_id)
-    # Value: id (UUID)
-    lookup = {}
-    for _, row in df.iterrows():
-        key = (
-            row['order_external_id'],
-            row['line_item_external_id'], 
-            row['variant_external_id'],
-            row['product_external_id']
-        )
-        lookup[key] = row['id']
+    # Composite key (order_external_id, line_item_external_id, variant_external_id, product_external_id)
+    # -> id (UUID), renamed to the refund-side column names so it can be merged on directly
+    lookup = pd.read_csv(ordered_variants_file, usecols=list(ORDERED_VARIANT_LOOKUP_COLUMNS)).rename(
+        columns=ORDERED_VARIANT_LOOKUP_COLUMNS
+    )
+    # Keep one id per key (the last one, as a dict built from the rows would)
+    lookup = lookup.drop_duplicates(subset=ORDERED_VARIANT_KEY, keep='last')
     
     print(f"  Loaded {len(lookup)} ordered variant records for lookup")
     return lookup
 
-def find_ordered_variant_id(lookup_dict, order_id, line_item_id, variant_id, product_id):
-    """Find the ordered variant ID from the lookup dictionary"""
-    key = (order_id, line_item_id, variant_id, product_id)
-    
-    if key in lookup_dict:
-        return lookup_dict[key]
-    else:
-        print(f"    Warning: No ordered variant found for {key}")
-        return None
+def random_datetimes_with_timezone(dates, rng):
+    """Add a random time of day to parsed dates and format them as UTC ISO datetimes for PostgreSQL
 
-def convert_date_to_datetime_with_timezone(date_str):
-    """Convert date string to datetime with timezone for PostgreSQL compatibility"""
-    try:
-        # Parse the date (assuming format like '2024-02-06')
-        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-        
-        # Add random time component (between 00:00:00 and 23:59:59)
-        hour = random.randint(0, 23)
-        minute = random.randint(0, 59)
-        second = random.randint(0, 59)
-        
-        # Create datetime with time component
-        datetime_obj = date_obj.replace(hour=hour, minute=minute, second=second)
-        
-        # Add UTC timezone
-        datetime_with_tz = datetime_obj.replace(tzinfo=timezone.utc)
-        
-        # Return in ISO format with timezone
-        return datetime_with_tz.isoformat()
-        
-    except ValueError:
-        # If parsing fails, return current datetime with timezone
-        return datetime.now(timezone.utc).isoformat()
+    Like '2024-02-06T13:04:05+00:00'; dates that failed to parse (NaT) get the current datetime instead.
+    """
+    seconds = pd.to_timedelta(rng.integers(0, 86400, len(dates)), unit='s')
+    datetimes = (dates + seconds).dt.strftime('%Y-%m-%dT%H:%M:%S+00:00')
+    return datetimes.fillna(datetime.now(timezone.utc).isoformat())
 
 def create_variant_attributes_json(variant):
     """Create JSONB-compatible variant attributes"""
@@ -180,8 +128,139 @@ def create_taxes_json():
         "tax_amount": 0.0
     })
 
-def export_all_returned_variants_to_csv(data, mappings, output_file="kirill_convert_maria_returned_variants.csv"):
-    """Export all refunded line items with related data to CSV file"""
+def build_returned_variants(suffix, data, ordered_variants_lookup, headers, current_time, taxes):
+    """Build the returned variants DataFrame for one dataset (A, B, C or D)
+
+    Returns (DataFrame, messages): the datasets run in parallel threads, so the progress and warning
+    lines are collected here and printed by the caller in dataset order.
+    """
+    # Columns joined onto each refund (the refund itself carries the order_id; the line item adds its variant)
+    line_item_columns = ['line_item_id', 'variant_id']
+    order_columns = ['order_id', 'customer_id', 'order_date', 'status', 'street', 'city', 'postal_code',
+                     'country', 'total_amount']
+    customer_columns = ['customer_id', 'name', 'email']
+    variant_columns = ['variant_id', 'product_id', 'color', 'size', 'sku', 'price']
+    product_columns = ['product_id', 'product_name', 'category']
+    
+    messages = [f"  Processing dataset {suffix}..."]
+    
+    refunds_df = data['refunds'][suffix]
+    
+    # Handle potential duplicates by dropping them (the first row per key wins); only the joined
+    # columns are copied, and the merges below hash-join on the key instead of per-row dict lookups
+    line_items_df = data['line_items'][suffix][line_item_columns].drop_duplicates(subset=['line_item_id'])
+    orders_df = data['orders'][suffix][order_columns].drop_duplicates(subset=['order_id'])
+    customers_df = data['customers'][suffix][customer_columns].drop_duplicates(subset=['customer_id'])
+    products_df = data['products'][suffix][product_columns].drop_duplicates(subset=['product_id'])
+    variants_df = data['variants'][suffix][variant_columns].drop_duplicates(subset=['variant_id'])
+    
+    # Variant attributes are per variant, so encode them once per variant rather than once per refund
+    variants_df = variants_df.assign(variant_attributes=[
+        create_variant_attributes_json(variant) for variant in variants_df.to_dict('records')
+    ])
+    
+    # Check if line items exist (some refunds might reference non-existent line items)
+    missing_line_item = ~refunds_df['line_item_id'].isin(line_items_df['line_item_id'])
+    for refund_id, line_item_id in zip(refunds_df.loc[missing_line_item, 'refund_id'], refunds_df.loc[missing_line_item, 'line_item_id']):
+        messages.append(f"    Warning: Line item {line_item_id} not found, skipping refund {refund_id}")
+    
+    # Check if orders exist
+    missing_order = ~missing_line_item & ~refunds_df['order_id'].isin(orders_df['order_id'])
+    for refund_id, order_id in zip(refunds_df.loc[missing_order, 'refund_id'], refunds_df.loc[missing_order, 'order_id']):
+        messages.append(f"    Warning: Order {order_id} not found, skipping refund {refund_id}")
+    
+    # Join every refund to its line item, order, customer, variant and product in one pass
+    # (inner joins keep the refund order; each key is unique on the right side after deduplication)
+    returns = (
+        refunds_df[~missing_line_item & ~missing_order]
+        .merge(line_items_df, on='line_item_id', how='inner', validate='many_to_one')
+        .merge(orders_df, on='order_id', how='inner', validate='many_to_one')
+        .merge(customers_df, on='customer_id', how='inner', validate='many_to_one')
+        .merge(variants_df, on='variant_id', how='inner', validate='many_to_one')
+        .merge(products_df, on='product_id', how='inner', validate='many_to_one')
+    )
+    
+    # Find the ordered variant IDs from the lookup
+    returns = returns.merge(ordered_variants_lookup, on=ORDERED_VARIANT_KEY, how='left', validate='many_to_one')
+    
+    # Skip refunds we can't find the corresponding ordered variant for
+    missing_ordered_variant = returns['ordered_variant_id'].isna()
+    for key, refund_id in zip(returns.loc[missing_ordered_variant, ORDERED_VARIANT_KEY].itertuples(index=False, name=None),
+                              returns.loc[missing_ordered_variant, 'refund_id']):
+        messages.append(f"    Warning: No ordered variant found for {key}")
+        messages.append(f"    Warning: Skipping refund {refund_id} - no matching ordered variant found")
+    returns = returns[~missing_ordered_variant]
+    
+    # Calculate returned amounts
+    returned_subtotal = returns['refund_amount']
+    returned_subtotal_tax = returned_subtotal * 0.20  # Assuming 20% VAT
+    
+    # Parse customer names
+    first_names, last_names = split_customer_names(returns['name'])
+    
+    # Convert dates to datetimes with timezone (each date parsed once, separate random times per column;
+    # a Generator per dataset since the datasets run in parallel threads)
+    rng = np.random.default_rng()
+    order_dates = pd.to_datetime(returns['order_date'], format='%Y-%m-%d', errors='coerce')
+    refund_dates = pd.to_datetime(returns['refund_date'], format='%Y-%m-%d', errors='coerce')
+    
+    df = pd.DataFrame({
+        'id': [str(uuid.uuid4()) for _ in range(len(returns))],
+        'ordered_variant_id': returns['ordered_variant_id'],
+        'parent_order_external_id': returns['order_id'],
+        'refund_external_id': returns['refund_id'],
+        'refund_date_created': random_datetimes_with_timezone(refund_dates, rng),
+        'refund_amount': returns['refund_amount'],
+        'refund_reason': returns['reason'],
+        'refunded_by': 'system',  # Default value
+        'refunded_payment': True,  # Assuming payment was refunded
+        'order_status': returns['status'],
+        'order_total_amount': returns['total_amount'],
+        'order_currency': 'EUR',
+        'order_created_at': random_datetimes_with_timezone(order_dates, rng),
+        'order_updated_at': random_datetimes_with_timezone(order_dates, rng),
+        'customer_email': returns['email'],
+        'customer_phone_number': '',  # Not available in source data
+        'shipping_first_name': first_names,
+        'shipping_last_name': last_names,
+        'shipping_address_1': returns['street'],
+        'shipping_address_2': '',  # Not available in source data
+        'shipping_city': returns['city'],
+        'shipping_state': '',  # Not available in source data
+        'shipping_postcode': returns['postal_code'],
+        'shipping_country_code': returns['country'].str[:2].str.upper(),
+        'product_external_id': returns['product_id'],
+        'product_title': returns['product_name'],
+        'product_description': returns['category'] + ' product',
+        'variant_external_id': returns['variant_id'],
+        'variant_title': returns['product_name'] + ' - ' + returns['color'] + ' - ' + returns['size'],
+        'variant_sku': returns['sku'],
+        'variant_price': returns['price'],
+        'variant_attributes': returns['variant_attributes'],
+        'variant_image_id': '',  # Not available in source data
+        'variant_image_src': '',  # Not available in source data
+        'returned_line_item_external_id': returns['line_item_id'],
+        'returned_quantity': returns['quantity_refunded'],
+        'returned_unit_price': returns['price'],
+        'returned_subtotal': returned_subtotal,
+        'returned_subtotal_tax': returned_subtotal_tax,
+        'returned_total': returned_subtotal,
+        'returned_total_tax': returned_subtotal_tax,
+        'returned_currency': 'EUR',
+        'tax_class': 'standard',  # Default tax class
+        'taxes': taxes,
+        'profile_id': '',  # Will be NULL, to be set by foreign key
+        'group_order_id': convert_order_ids_to_uuids(returns['order_id']),
+        'created_at': current_time,
+        'updated_at': current_time,
+        'category_id': '',  # Will be NULL, to be set by foreign key
+        'category': returns['category']
+    }, columns=headers)
+    
+    return df, messages
+
+def export_all_returned_variants_to_csv(data, output_file="kirill_convert_maria_returned_variants.csv"):
+    """Export all refunded line items with related data to CSV file (joins the frames directly)"""
     print(f"Exporting all returned variants to {output_file}...")
     
     # Load the ordered variants lookup
@@ -203,160 +282,31 @@ def export_all_returned_variants_to_csv(data, mappings, output_file="kirill_conv
         'profile_id', 'group_order_id', 'created_at', 'updated_at', 'category_id', 'category'
     ]
     
-    # List to store all rows
-    all_rows = []
+    # Get current timestamp with timezone (one export run, one created_at/updated_at)
+    current_time = datetime.now(timezone.utc).isoformat()
+    taxes = create_taxes_json()
     
-    # Process each dataset (A, B, C, D)
+    # Process each dataset (A, B, C, D); they are independent and pandas releases the GIL in
+    # its merges and string kernels, so they overlap in a thread pool (map keeps the order)
     suffixes = ['A', 'B', 'C', 'D']
     
-    for suffix in suffixes:
-        print(f"  Processing dataset {suffix}...")
-        
-        refunds_df = data['refunds'][suffix]
-        line_items_df = data['line_items'][suffix]
-        orders_df = data['orders'][suffix]
-        customers_df = data['customers'][suffix]
-        products_df = data['products'][suffix]
-        variants_df = data['variants'][suffix]
-        
-        # Create lookup dictionaries for faster access
-        # Handle potential duplicates by dropping them
-        line_items_dict = line_items_df.drop_duplicates(subset=['line_item_id']).set_index('line_item_id').to_dict('index')
-        orders_dict = orders_df.drop_duplicates(subset=['order_id']).set_index('order_id').to_dict('index')
-        customers_dict = customers_df.drop_duplicates(subset=['customer_id']).set_index('customer_id').to_dict('index')
-        products_dict = products_df.drop_duplicates(subset=['product_id']).set_index('product_id').to_dict('index')
-        variants_dict = variants_df.drop_duplicates(subset=['variant_id']).set_index('variant_id').to_dict('index')
-        
-        # Process each refund
-        for _, refund in refunds_df.iterrows():
-            # Get related data
-            line_item_id = refund['line_item_id']
-            order_id = refund['order_id']
-            
-            # Check if line item exists (some refunds might reference non-existent line items)
-            if line_item_id not in line_items_dict:
-                print(f"    Warning: Line item {line_item_id} not found, skipping refund {refund['refund_id']}")
-                continue
-                
-            # Check if order exists
-            if order_id not in orders_dict:
-                print(f"    Warning: Order {order_id} not found, skipping refund {refund['refund_id']}")
-                continue
-            
-            line_item = line_items_dict[line_item_id]
-            order = orders_dict[order_id]
-            customer_id = order['customer_id']
-            customer = customers_dict[customer_id]
-            variant_id = line_item['variant_id']
-            variant = variants_dict[variant_id]
-            product_id = variant['product_id']
-            product = products_dict[product_id]
-            
-            # Calculate returned amounts
-            returned_quantity = refund['quantity_refunded']
-            returned_unit_price = variant['price']
-            returned_subtotal = refund['refund_amount']
-            returned_subtotal_tax = returned_subtotal * 0.20  # Assuming 20% VAT
-            returned_total = returned_subtotal
-            returned_total_tax = returned_subtotal_tax
-            
-            # Parse customer name (assuming format: "First Last" or "Title First Last")
-            name_parts = customer['name'].split()
-            if len(name_parts) >= 2:
-                # Handle titles like "Univ.Prof."
-                if name_parts[0].endswith('.'):
-                    first_name = name_parts[1] if len(name_parts) > 1 else name_parts[0]
-                    last_name = ' '.join(name_parts[2:]) if len(name_parts) > 2 else ''
-                else:
-                    first_name = name_parts[0]
-                    last_name = ' '.join(name_parts[1:])
-            else:
-                first_name = customer['name']
-                last_name = ''
-            
-            # Get current timestamp with timezone
-            current_time = datetime.now(timezone.utc).isoformat()
-            
-            # Convert dates to datetime with timezone
-            order_created_datetime = convert_date_to_datetime_with_timezone(order['order_date'])
-            order_updated_datetime = convert_date_to_datetime_with_timezone(order['order_date'])
-            refund_date_datetime = convert_date_to_datetime_with_timezone(refund['refund_date'])
-            
-            # Find the ordered variant ID from the lookup
-            ordered_variant_id = find_ordered_variant_id(
-                ordered_variants_lookup, 
-                order_id, 
-                line_item_id, 
-                variant_id, 
-                product_id
-            )
-            
-            # Skip this refund if we can't find the corresponding ordered variant
-            if ordered_variant_id is None:
-                print(f"    Warning: Skipping refund {refund['refund_id']} - no matching ordered variant found")
-                continue
-            
-            # Create row data
-            row = {
-                'id': str(uuid.uuid4()),
-                'ordered_variant_id': ordered_variant_id,
-                'parent_order_external_id': order_id,
-                'refund_external_id': refund['refund_id'],
-                'refund_date_created': refund_date_datetime,
-                'refund_amount': refund['refund_amount'],
-                'refund_reason': refund['reason'],
-                'refunded_by': 'system',  # Default value
-                'refunded_payment': True,  # Assuming payment was refunded
-                'order_status': order['status'],
-                'order_total_amount': order['total_amount'],
-                'order_currency': 'EUR',
-                'order_created_at': order_created_datetime,
-                'order_updated_at': order_updated_datetime,
-                'customer_email': customer['email'],
-                'customer_phone_number': '',  # Not available in source data
-                'shipping_first_name': first_name,
-                'shipping_last_name': last_name,
-                'shipping_address_1': order['street'],
-                'shipping_address_2': '',  # Not available in source data
-                'shipping_city': order['city'],
-                'shipping_state': '',  # Not available in source data
-                'shipping_postcode': order['postal_code'],
-                'shipping_country_code': order['country'][:2].upper() if len(order['country']) > 2 else order['country'].upper(),
-                'product_external_id': product_id,
-                'product_title': product['product_name'],
-                'product_description': f"{product['category']} product",
-                'variant_external_id': variant_id,
-                'variant_title': f"{product['product_name']} - {variant['color']} - {variant['size']}",
-                'variant_sku': variant['sku'],
-                'variant_price': variant['price'],
-                'variant_attributes': create_variant_attributes_json(variant),
-                'variant_image_id': '',  # Not available in source data
-                'variant_image_src': '',  # Not available in source data
-                'returned_line_item_external_id': line_item_id,
-                'returned_quantity': returned_quantity,
-                'returned_unit_price': returned_unit_price,
-                'returned_subtotal': returned_subtotal,
-                'returned_subtotal_tax': returned_subtotal_tax,
-                'returned_total': returned_total,
-                'returned_total_tax': returned_total_tax,
-                'returned_currency': 'EUR',
-                'tax_class': 'standard',  # Default tax class
-                'taxes': create_taxes_json(),
-                'profile_id': '',  # Will be NULL, to be set by foreign key
-                'group_order_id': convert_order_id_to_uuid(order_id),
-                'created_at': current_time,
-                'updated_at': current_time,
-                'category_id': '',  # Will be NULL, to be set by foreign key
-                'category': product['category']
-            }
-            
-            all_rows.append(row)
+    with ThreadPoolExecutor(max_workers=len(suffixes)) as executor:
+        results = list(executor.map(
+            lambda suffix: build_returned_variants(suffix, data, ordered_variants_lookup, headers, current_time, taxes),
+            suffixes
+        ))
     
-    # Create DataFrame and export to CSV
-    df = pd.DataFrame(all_rows, columns=headers)
+    frames = []
+    for frame, messages in results:
+        for message in messages:
+            print(message)
+        frames.append(frame)
+    
+    # Combine the datasets and export to CSV
+    df = pd.concat(frames, ignore_index=True)
     df.to_csv(output_file, index=False, encoding='utf-8')
     
-    print(f"✓ Successfully exported {len(all_rows)} returned variants to {output_file}")
+    print(f"✓ Successfully exported {len(df)} returned variants to {output_file}")
     print(f"  Total datasets processed: {len(suffixes)}")
     print(f"  File size: {os.path.getsize(output_file) / 1024:.1f} KB")
     
@@ -368,10 +318,6 @@ def main():
     # Read all CSV files
     data = read_all_csv_files()
     
-    # Create mappings
-    print("\nCreating relationship mappings...")
-    mappings = create_mappings(data)
-    
     # Show some statistics
     print(f"\nDATA SUMMARY:")
     total_refunds = 0
@@ -393,7 +339,7 @@ def main():
     print("EXPORTING RETURNED VARIANTS TO CSV")
     print("="*60)
     
-    exported_df = export_all_returned_variants_to_csv(data, mappings)
+    exported_df = export_all_returned_variants_to_csv(data)
     
     print("\n" + "="*60)
     print("EXPORT COMPLETED!")